@@ -19,13 +19,17 @@ async def list_blacklist(
     db: AsyncSession = Depends(get_db),
 ):
     """List blacklist entries, optionally filtered by follower."""
-    query = select(BlacklistEntry).order_by(
-        BlacklistEntry.follower_id, BlacklistEntry.symbol
-    )
+    query = select(
+        BlacklistEntry.id,
+        BlacklistEntry.follower_id,
+        BlacklistEntry.symbol,
+        BlacklistEntry.reason,
+        BlacklistEntry.created_at,
+    ).order_by(BlacklistEntry.follower_id, BlacklistEntry.symbol)
     if follower_id:
         query = query.where(BlacklistEntry.follower_id == follower_id)
     result = await db.execute(query)
-    return result.scalars().all()
+    return result.all()
 
 
 @router.post("", response_model=BlacklistEntryResponse, status_code=201)
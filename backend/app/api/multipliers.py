@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import re
-
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.symbol_multiplier import SymbolMultiplier
 from app.schemas.multipliers import SymbolMultiplierResponse, SymbolMultiplierUpdate
 
-_TICKER_RE = re.compile(r"^[A-Za-z]{1,5}$")
+
+def _is_ticker(symbol: str) -> bool:
+    """Return True for 1-5 ASCII letters."""
+    return len(symbol) <= 5 and symbol.isascii() and symbol.isalpha()
+
 
 router = APIRouter(prefix="/api/multipliers", tags=["multipliers"])
 
@@ -23,12 +26,21 @@ async def get_multipliers(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all symbol multiplier overrides for a follower."""
+    # Plain column rows: the response model reads them by attribute, so there
+    # is no need to build ORM instances just to serialize them
     result = await db.execute(
-        select(SymbolMultiplier)
+        select(
+            SymbolMultiplier.id,
+            SymbolMultiplier.follower_id,
+            SymbolMultiplier.symbol,
+            SymbolMultiplier.multiplier,
+            SymbolMultiplier.source,
+            SymbolMultiplier.updated_at,
+        )
         .where(SymbolMultiplier.follower_id == follower_id)
         .order_by(SymbolMultiplier.symbol)
     )
-    return result.scalars().all()
+    return result.all()
 
 
 @router.put(
@@ -43,33 +55,34 @@ async def set_multiplier(
 ):
     """Set or update a per-symbol multiplier override."""
     symbol = symbol.strip().upper()
-    if not _TICKER_RE.match(symbol):
+    if not _is_ticker(symbol):
         raise HTTPException(422, "Symbol must be 1-5 letters only")
+    # One round trip: insert or update on (follower_id, symbol) and read the
+    # stored row back
+    stmt = sqlite_insert(SymbolMultiplier).values(
+        follower_id=follower_id,
+        symbol=symbol,
+        multiplier=body.multiplier,
+        source="user_override",
+    )
     result = await db.execute(
-        select(SymbolMultiplier).where(
-            SymbolMultiplier.follower_id == follower_id,
-            SymbolMultiplier.symbol == symbol,
+        stmt.on_conflict_do_update(
+            index_elements=["follower_id", "symbol"],
+            set_={
+                "multiplier": stmt.excluded.multiplier,
+                "source": stmt.excluded.source,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            SymbolMultiplier.id,
+            SymbolMultiplier.follower_id,
+            SymbolMultiplier.symbol,
+            SymbolMultiplier.multiplier,
+            SymbolMultiplier.source,
+            SymbolMultiplier.updated_at,
         )
     )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        existing.multiplier = body.multiplier
-        existing.source = "user_override"
-        await db.flush()
-        await db.refresh(existing)
-        return existing
-    else:
-        obj = SymbolMultiplier(
-            follower_id=follower_id,
-            symbol=symbol,
-            multiplier=body.multiplier,
-            source="user_override",
-        )
-        db.add(obj)
-        await db.flush()
-        await db.refresh(obj)
-        return obj
+    return result.one()
 
 
 @router.delete("/{follower_id}/{symbol}", status_code=204)
@@ -80,7 +93,7 @@ async def remove_multiplier(
 ):
     """Remove a per-symbol multiplier override (revert to base multiplier)."""
     symbol = symbol.strip().upper()
-    if not _TICKER_RE.match(symbol):
+    if not _is_ticker(symbol):
         raise HTTPException(422, "Symbol must be 1-5 letters only")
     result = await db.execute(
         select(SymbolMultiplier).where(
@@ -22,6 +22,7 @@ from app.schemas.reconcile import (
     ReconcileFollowerData,
     ReconcilePositionEntry,
     ReconcileResponse,
+    ReconcileScenario,
 )
 from app.services.das_service import DASService
 
@@ -59,12 +60,12 @@ def _classify_position(
     master_side: str,
     follower_qty: int,
     follower_side: str | None,
-) -> tuple[str, float | None]:
+) -> tuple[ReconcileScenario, float | None]:
     """Determine scenario and inferred multiplier for a symbol.
 
     Returns (scenario, inferred_multiplier).
     """
-    if follower_qty == 0 or follower_side is None:
+    if follower_qty == 0 or follower_side is None or master_qty == 0:
         return "master_only", None
 
     same_dir = (
@@ -107,9 +108,14 @@ async def get_reconciliation(
     if not master or not master.is_running:
         return ReconcileResponse(followers=[], has_entries=False)
 
-    # Build master position map
-    master_positions = {pos.symbol: pos for pos in master.positions}
-    if not master_positions:
+    # Read master positions once, sorted by symbol: (symbol, qty, side).
+    # Flat positions have nothing to reconcile.
+    master_rows = sorted(
+        (pos.symbol, pos.quantity, pos.position_type.name)
+        for pos in master.positions
+        if pos.quantity
+    )
+    if not master_rows:
         return ReconcileResponse(followers=[], has_entries=False)
 
     # Parse follower filter
@@ -134,12 +140,9 @@ async def get_reconciliation(
         follower_positions = {pos.symbol: pos for pos in client.positions}
 
         entries: list[ReconcilePositionEntry] = []
-        for symbol in sorted(master_positions):
-            m_pos = master_positions[symbol]
+        for symbol, m_qty, m_side in master_rows:
             f_pos = follower_positions.get(symbol)
 
-            m_qty = m_pos.quantity
-            m_side = m_pos.position_type.name
             f_qty = f_pos.quantity if f_pos else 0
             f_side = f_pos.position_type.name if f_pos else None
 
@@ -149,6 +152,7 @@ async def get_reconciliation(
                 "use_inferred" if scenario == "common_same_dir" else "blacklist"
             )
 
+            current_multiplier, current_source = multiplier_mgr.resolve(fid, symbol)
             entries.append(
                 ReconcilePositionEntry(
                     symbol=symbol,
@@ -158,8 +162,8 @@ async def get_reconciliation(
                     follower_side=f_side,
                     scenario=scenario,
                     inferred_multiplier=inferred,
-                    current_multiplier=multiplier_mgr.get_effective(fid, symbol),
-                    current_source=multiplier_mgr.get_source(fid, symbol),
+                    current_multiplier=current_multiplier,
+                    current_source=current_source,
                     is_blacklisted=blacklist_mgr.is_blacklisted(fid, symbol),
                     default_action=default_action,
                 )
@@ -182,8 +182,7 @@ async def _load_and_connect() -> dict[str, dict[str, Any]]:
     await das.start()
 
     # Load persistent engine state (multipliers, blacklist)
-    await engine.multiplier_manager.load_from_db()
-    await engine.blacklist_manager.load_from_db()
+    await engine.load_persistent_state()
 
     return follower_configs
 
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.engine.replication_engine import ReplicationEngine
@@ -45,9 +45,9 @@ async def websocket_endpoint(ws: WebSocket):
             # Listen for client messages (actions)
             data = await ws.receive_text()
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 await _handle_client_message(message)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning("Invalid JSON from WebSocket client: %s", data[:100])
             except Exception as e:
                 logger.error("Error handling WS message: %s", e)
@@ -48,6 +48,13 @@ class AppConfig(BaseSettings):
     # DAS-bridge server configurations (JSON array string)
     das_servers: str = "[]"
 
+    # Replication – max follower DAS calls in flight per fan-out
+    max_concurrent_follower_ops: int = 8
+    # Replication – max queued actions kept per offline follower
+    action_queue_max_per_follower: int = 1000
+    # Short sales – max smart_locate() calls in flight across all followers
+    max_concurrent_locates: int = 3
+
     model_config = {
         "extra": "ignore",
     }
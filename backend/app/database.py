@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -16,6 +18,11 @@ class Base(DeclarativeBase):
     pass
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON columns (e.g. ``locate_routes``) with orjson."""
+    return orjson.dumps(value).decode()
+
+
 _engine = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
@@ -29,6 +36,8 @@ def get_engine():
             config.database_url,
             echo=config.log_level == "DEBUG",
             connect_args={"check_same_thread": False},
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
         )
     return _engine
 
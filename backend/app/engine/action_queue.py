@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import logging
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from decimal import Decimal
 from enum import StrEnum
-from typing import Any
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,30 @@ class QueuedActionType(StrEnum):
     ORDER_REPLACE = "order_replace"
 
 
-@dataclass
+class SubmitPayload(NamedTuple):
+    """Payload of a queued ORDER_SUBMIT."""
+
+    master_order_id: int
+
+
+class CancelPayload(NamedTuple):
+    """Payload of a queued ORDER_CANCEL."""
+
+    master_order_id: int
+
+
+class ReplacePayload(NamedTuple):
+    """Payload of a queued ORDER_REPLACE."""
+
+    master_order_id: int
+    new_quantity: int | None
+    new_price: Decimal | None  # None when the order carries no price
+
+
+type QueuedPayload = SubmitPayload | CancelPayload | ReplacePayload
+
+
+@dataclass(slots=True)
 class QueuedAction:
     """A single action that was deferred because the follower was disconnected."""
 
@@ -31,30 +55,53 @@ class QueuedAction:
     follower_id: str
     action_type: QueuedActionType
     symbol: str
+    # Payload type matches action_type (see the *Payload tuples above)
+    payload: QueuedPayload
     timestamp: float = field(default_factory=time.time)
 
-    # Payload differs by action_type;
-    # ORDER_SUBMIT  → {"master_order_id": int}
-    # ORDER_CANCEL  → {"master_order_id": int}
-    # ORDER_REPLACE → {"master_order_id": int,
-    #   "new_quantity": int|None, "new_price": str|None}
-    payload: dict[str, Any] = field(default_factory=lambda: {})
-
     def to_dict(self) -> dict[str, Any]:
         """Convert to a plain dictionary with serialized enum values."""
-        d = asdict(self)
-        d["action_type"] = self.action_type.value
-        return d
+        return {
+            "id": self.id,
+            "follower_id": self.follower_id,
+            "action_type": self.action_type.value,
+            "symbol": self.symbol,
+            "timestamp": self.timestamp,
+            "payload": {
+                k: str(v) if isinstance(v, Decimal) else v
+                for k, v in self.payload._asdict().items()
+            },
+        }
+
+
+def _eviction_victim(queue: list[QueuedAction], new: QueuedAction) -> QueuedAction:
+    """Pick the action to evict from a full *queue* to make room for *new*."""
+    own_order = new.payload.master_order_id
+    others = [a for a in queue if a.payload.master_order_id != own_order] or queue
+    for a in others:
+        if a.action_type is new.action_type and a.symbol == new.symbol:
+            return a
+    return others[0]
 
 
 class ActionQueue:
     """Per-follower queue of deferred actions."""
 
-    def __init__(self) -> None:
-        """Initialize an empty action queue."""
+    def __init__(self, max_per_follower: int = 1000) -> None:
+        """Initialize an empty action queue.
+
+        Args:
+            max_per_follower: Cap on queued actions per follower. Once reached,
+                an older master order's actions are dropped to make room for
+                the new one (see ``enqueue``).
+        """
         # follower_id → list of queued actions (ordered by timestamp)
         self._queues: dict[str, list[QueuedAction]] = {}
         self._counter = 0
+        self._max_per_follower = max_per_follower
+        # Followers that hit the cap: pending report / already reported
+        self._overflowed: list[str] = []
+        self._overflow_reported: set[str] = set()
 
     def _next_id(self) -> str:
         self._counter += 1
@@ -67,17 +114,51 @@ class ActionQueue:
         follower_id: str,
         action_type: QueuedActionType,
         symbol: str,
-        payload: dict[str, Any] | None = None,
+        payload: QueuedPayload,
     ) -> QueuedAction:
-        """Add an action to the queue for a follower."""
+        """Add an action to the queue for a follower.
+
+        A replace carries the master order's full quantity and price, so it
+        supersedes any earlier queued replace of the same master order.
+
+        If the follower's queue is full, the oldest queued action of the same
+        type and symbol is evicted (the oldest action of any type if there is
+        none), preferring other master orders than the new action's. Every
+        queued action of the evicted action's master order goes with it, so a
+        replace or cancel is never left behind without its submit.
+        """
         action = QueuedAction(
             id=self._next_id(),
             follower_id=follower_id,
             action_type=action_type,
             symbol=symbol,
-            payload=payload or {},
+            payload=payload,
         )
-        self._queues.setdefault(follower_id, []).append(action)
+        queue = self._queues.setdefault(follower_id, [])
+        if action_type is QueuedActionType.ORDER_REPLACE:
+            master_order_id = payload.master_order_id
+            queue[:] = [
+                a
+                for a in queue
+                if a.action_type is not QueuedActionType.ORDER_REPLACE
+                or a.payload.master_order_id != master_order_id
+            ]
+        if len(queue) >= self._max_per_follower:
+            victim = _eviction_victim(queue, action)
+            evicted_id = victim.payload.master_order_id
+            queue[:] = [a for a in queue if a.payload.master_order_id != evicted_id]
+            logger.warning(
+                "Action queue full for follower %s — dropped queued actions of "
+                "master order %s (oldest: %s for %s)",
+                follower_id,
+                evicted_id,
+                victim.action_type.value,
+                victim.symbol,
+            )
+            if follower_id not in self._overflow_reported:
+                self._overflow_reported.add(follower_id)
+                self._overflowed.append(follower_id)
+        queue.append(action)
         logger.info(
             "Queued %s for follower %s: %s",
             action_type.value,
@@ -100,6 +181,18 @@ class ActionQueue:
         """Check if a follower has any pending queued actions."""
         return bool(self._queues.get(follower_id))
 
+    def pending_count(self, follower_id: str) -> int:
+        """Return the number of pending queued actions for a follower."""
+        return len(self._queues.get(follower_id, ()))
+
+    def take_overflowed(self) -> list[str]:
+        """Return followers whose queue newly hit the cap, then forget them.
+
+        Each follower is reported once until its queue is cleared or trimmed.
+        """
+        overflowed, self._overflowed = self._overflowed, []
+        return overflowed
+
     # ---- removal ----
 
     def remove(self, follower_id: str, action_ids: set[str]) -> list[QueuedAction]:
@@ -110,15 +203,20 @@ class ActionQueue:
         self._queues[follower_id] = [
             a for a in self._queues[follower_id] if a.id not in action_ids
         ]
+        if removed:
+            self._overflow_reported.discard(follower_id)
         return removed
 
     def clear(self, follower_id: str) -> list[QueuedAction]:
         """Clear all queued actions for a follower. Returns them."""
+        self._overflow_reported.discard(follower_id)
         return self._queues.pop(follower_id, [])
 
     def clear_all(self) -> None:
         """Clear all queued actions for every follower."""
         self._queues.clear()
+        self._overflowed.clear()
+        self._overflow_reported.clear()
 
     # ---- serialisation ----
 
@@ -14,6 +14,8 @@ from app.models.blacklist import BlacklistEntry
 
 logger = logging.getLogger(__name__)
 
+_NO_FOLLOWERS: frozenset[str] = frozenset()
+
 
 class BlacklistManager:
     """Manages the per-follower, per-symbol blacklist."""
@@ -22,6 +24,8 @@ class BlacklistManager:
         """Initialize an empty in-memory blacklist cache."""
         # (follower_id, symbol) → reason
         self._blacklist: dict[tuple[str, str], str] = {}
+        # symbol → blacklisted follower_ids, kept in step with ``_blacklist``
+        self._by_symbol: dict[str, frozenset[str]] = {}
 
     async def load_from_db(self) -> None:
         """Load all blacklist entries from the database."""
@@ -32,12 +36,31 @@ class BlacklistManager:
                 self._blacklist[(entry.follower_id, entry.symbol.upper())] = (
                     entry.reason or "unknown"
                 )
+        by_symbol: dict[str, set[str]] = {}
+        for fid, sym in self._blacklist:
+            by_symbol.setdefault(sym, set()).add(fid)
+        self._by_symbol = {sym: frozenset(fids) for sym, fids in by_symbol.items()}
         logger.info("Loaded %d blacklist entries", len(self._blacklist))
 
     def is_blacklisted(self, follower_id: str, symbol: str) -> bool:
         """Check if a symbol is blacklisted for a specific follower."""
         return (follower_id, symbol.upper()) in self._blacklist
 
+    def blacklisted_for(self, symbol: str) -> frozenset[str]:
+        """Return the follower IDs that have *symbol* blacklisted."""
+        return self._by_symbol.get(symbol.upper(), _NO_FOLLOWERS)
+
+    def _index_add(self, follower_id: str, symbol: str) -> None:
+        existing = self._by_symbol.get(symbol, _NO_FOLLOWERS)
+        self._by_symbol[symbol] = existing | {follower_id}
+
+    def _index_discard(self, follower_id: str, symbol: str) -> None:
+        remaining = self._by_symbol.get(symbol, _NO_FOLLOWERS) - {follower_id}
+        if remaining:
+            self._by_symbol[symbol] = remaining
+        else:
+            self._by_symbol.pop(symbol, None)
+
     def get_blacklisted_symbols(self, follower_id: str) -> list[str]:
         """Get all blacklisted symbols for a specific follower."""
         return [sym for (fid, sym) in self._blacklist if fid == follower_id]
@@ -57,6 +80,7 @@ class BlacklistManager:
             return False
 
         self._blacklist[key] = reason
+        self._index_add(follower_id, symbol)
 
         factory = get_session_factory()
         async with factory() as session:
@@ -84,6 +108,7 @@ class BlacklistManager:
             return False
 
         del self._blacklist[key]
+        self._index_discard(follower_id, symbol)
 
         factory = get_session_factory()
         async with factory() as session:
@@ -110,7 +135,8 @@ class BlacklistManager:
                 return False
 
             key = (entry.follower_id, entry.symbol.upper())
-            self._blacklist.pop(key, None)
+            if self._blacklist.pop(key, None) is not None:
+                self._index_discard(*key)
             await session.delete(entry)
             await session.commit()
             return True
@@ -120,3 +146,4 @@ class BlacklistManager:
         keys_to_remove = [k for k in self._blacklist if k[0] == follower_id]
         for key in keys_to_remove:
             del self._blacklist[key]
+            self._index_discard(*key)
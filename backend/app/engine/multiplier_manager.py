@@ -9,10 +9,14 @@ Resolution order:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
+from collections.abc import Iterable
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database import get_session_factory
 from app.models.follower import Follower
@@ -20,14 +24,35 @@ from app.models.symbol_multiplier import SymbolMultiplier
 
 logger = logging.getLogger(__name__)
 
+# Override persistence is batched: the writer commits once it has this many
+# pending changes or once the batch window has elapsed, whichever is first.
+_WRITE_BATCH_SIZE = 64
+_WRITE_BATCH_WINDOW = 0.05  # seconds
+
+# (follower_id, symbol) → (multiplier, source), or None to delete the row
+type _OverrideWrite = tuple[tuple[str, str], tuple[float, str] | None]
+# A queued write and the future its caller awaits for the commit
+type _PendingWrite = tuple[_OverrideWrite, asyncio.Future[None]]
+
 
 class MultiplierManager:
     """Resolves effective multiplier per follower per symbol."""
 
+    __slots__ = (
+        "_base_multipliers",
+        "_symbol_overrides",
+        "_symbol_sources",
+        "_write_queue",
+        "_writer",
+        "_version",
+    )
+
     def __init__(self) -> None:
         """Initialize empty in-memory multiplier caches."""
         # In-memory caches for fast access (hot path during replication)
         self._base_multipliers: dict[str, float] = {}  # follower_id → base
+        # Override/source maps are copy-on-write snapshots: writers build a
+        # new dict and swap the reference, readers never see a mutation.
         self._symbol_overrides: dict[
             tuple[str, str], float
         ] = {}  # (follower_id, symbol) → mult
@@ -35,6 +60,18 @@ class MultiplierManager:
             tuple[str, str], str
         ] = {}  # (follower_id, symbol) → source
 
+        # Pending override writes, persisted in batches by a background task
+        self._write_queue: asyncio.Queue[_PendingWrite] = asyncio.Queue()
+        self._writer: asyncio.Task[None] | None = None
+
+        # Bumped on every in-memory change so readers can cache derived data
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever any multiplier changes."""
+        return self._version
+
     async def load_from_db(self) -> None:
         """Load all multipliers from the database into memory.
 
@@ -42,6 +79,9 @@ class MultiplierManager:
         ``source='auto_inferred'`` rows left over from the deprecated
         auto-inference feature.
         """
+        # Don't let rows from the DB clobber overrides that are still queued
+        await self.flush_writes()
+
         factory = get_session_factory()
         async with factory() as session:
             # Load base multipliers
@@ -67,11 +107,16 @@ class MultiplierManager:
                 )
 
             # Load symbol overrides (only user_override remain)
+            overrides = dict(self._symbol_overrides)
+            sources = dict(self._symbol_sources)
             result = await session.execute(select(SymbolMultiplier))
             for sm in result.scalars():
                 key = (sm.follower_id, sm.symbol)
-                self._symbol_overrides[key] = sm.multiplier
-                self._symbol_sources[key] = sm.source
+                overrides[key] = sm.multiplier
+                sources[key] = sys.intern(sm.source)
+            self._symbol_overrides = overrides
+            self._symbol_sources = sources
+            self._version += 1
 
         logger.info(
             "Loaded %d base multipliers, %d symbol overrides",
@@ -84,21 +129,43 @@ class MultiplierManager:
 
         Resolution: user_override > base_multiplier > 1.0
         """
-        key = (follower_id, symbol)
-        if key in self._symbol_overrides:
-            return self._symbol_overrides[key]
+        multiplier = self._symbol_overrides.get((follower_id, symbol))
+        if multiplier is not None:
+            return multiplier
         return self._base_multipliers.get(follower_id, 1.0)
 
     def get_source(self, follower_id: str, symbol: str) -> str:
         """Get the source of the effective multiplier."""
+        return self._symbol_sources.get((follower_id, symbol), "base")
+
+    def resolve(self, follower_id: str, symbol: str) -> tuple[float, str]:
+        """Get the effective multiplier and its source in one lookup."""
         key = (follower_id, symbol)
-        if key in self._symbol_sources:
-            return self._symbol_sources[key]
-        return "base"
+        multiplier = self._symbol_overrides.get(key)
+        if multiplier is not None:
+            return multiplier, self._symbol_sources.get(key, "base")
+        return self._base_multipliers.get(follower_id, 1.0), "base"
+
+    def get_effective_bulk(
+        self, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple[float, str]]:
+        """Resolve (multiplier, source) for many (follower_id, symbol) pairs."""
+        overrides = self._symbol_overrides
+        sources = self._symbol_sources
+        bases = self._base_multipliers
+        result: dict[tuple[str, str], tuple[float, str]] = {}
+        for key in pairs:
+            multiplier = overrides.get(key)
+            if multiplier is not None:
+                result[key] = (multiplier, sources.get(key, "base"))
+            else:
+                result[key] = (bases.get(key[0], 1.0), "base")
+        return result
 
     def set_base(self, follower_id: str, multiplier: float) -> None:
         """Update the in-memory base multiplier for a follower."""
         self._base_multipliers[follower_id] = multiplier
+        self._version += 1
 
     async def set_symbol_override(
         self,
@@ -107,33 +174,26 @@ class MultiplierManager:
         multiplier: float,
         source: str = "user_override",
     ) -> None:
-        """Set a per-symbol multiplier override and persist to DB."""
+        """Set a per-symbol multiplier override.
+
+        The in-memory cache is updated immediately; the DB write is queued,
+        committed in a batch by the background writer, and awaited here. If
+        the commit fails the in-memory change is rolled back and the error
+        is raised.
+        """
         key = (follower_id, symbol)
-        self._symbol_overrides[key] = multiplier
-        self._symbol_sources[key] = source
+        previous = self._current(key)
+        overrides = dict(self._symbol_overrides)
+        sources = dict(self._symbol_sources)
+        overrides[key] = multiplier
+        # Only a handful of distinct sources exist; interning lets every
+        # override (and every snapshot row) share one string object.
+        sources[key] = sys.intern(source)
+        self._symbol_overrides = overrides
+        self._symbol_sources = sources
+        self._version += 1
 
-        factory = get_session_factory()
-        async with factory() as session:
-            # Upsert
-            existing = await session.execute(
-                select(SymbolMultiplier).where(
-                    SymbolMultiplier.follower_id == follower_id,
-                    SymbolMultiplier.symbol == symbol,
-                )
-            )
-            sm = existing.scalar_one_or_none()
-            if sm:
-                sm.multiplier = multiplier
-                sm.source = source
-            else:
-                sm = SymbolMultiplier(
-                    follower_id=follower_id,
-                    symbol=symbol,
-                    multiplier=multiplier,
-                    source=source,
-                )
-                session.add(sm)
-            await session.commit()
+        await self._write((key, (multiplier, source)), previous)
 
         logger.info(
             "Set %s multiplier for %s/%s: %.4f",
@@ -144,39 +204,200 @@ class MultiplierManager:
         )
 
     async def remove_symbol_override(self, follower_id: str, symbol: str) -> None:
-        """Remove a per-symbol override, reverting to base multiplier."""
+        """Remove a per-symbol override, reverting to base multiplier.
+
+        The DB delete goes through the background writer and is awaited, as
+        in :meth:`set_symbol_override`.
+        """
         key = (follower_id, symbol)
-        self._symbol_overrides.pop(key, None)
-        self._symbol_sources.pop(key, None)
+        previous = self._current(key)
+        self._drop_overrides({key})
+        await self._write((key, None), previous)
+
+    def remove_follower(self, follower_id: str) -> None:
+        """Clean up all in-memory state for a removed follower.
+
+        Override writes still queued for the follower are dropped so they
+        can't recreate its rows.
+        """
+        if self._base_multipliers.pop(follower_id, None) is not None:
+            self._version += 1
+        self._drop_overrides({k for k in self._symbol_overrides if k[0] == follower_id})
+
+        queue = self._write_queue
+        kept: list[_PendingWrite] = []
+        while not queue.empty():
+            pending = queue.get_nowait()
+            queue.task_done()
+            (key, _), future = pending
+            if key[0] == follower_id:
+                if not future.done():
+                    future.set_result(None)
+            else:
+                kept.append(pending)
+        for pending in kept:
+            queue.put_nowait(pending)
+
+    def _current(self, key: tuple[str, str]) -> tuple[float, str] | None:
+        """Return the in-memory override for *key* as a write value."""
+        multiplier = self._symbol_overrides.get(key)
+        if multiplier is None:
+            return None
+        return multiplier, self._symbol_sources.get(key, "user_override")
+
+    def _drop_overrides(self, keys: set[tuple[str, str]]) -> None:
+        """Publish new override/source snapshots without *keys*."""
+        if not keys.intersection(self._symbol_overrides):
+            return
+        self._symbol_overrides = {
+            k: v for k, v in self._symbol_overrides.items() if k not in keys
+        }
+        self._symbol_sources = {
+            k: v for k, v in self._symbol_sources.items() if k not in keys
+        }
+        self._version += 1
+
+    # ---- persistence ----
+
+    async def _write(
+        self, write: _OverrideWrite, previous: tuple[float, str] | None
+    ) -> None:
+        """Queue *write* for the background writer and wait for its commit.
+
+        On failure the in-memory override is put back to *previous*, unless
+        a later change has replaced it in the meantime, and the error is
+        re-raised.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((write, future))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(
+                self._drain_writes(), name="multiplier-writer"
+            )
+        try:
+            await future
+        except Exception:
+            key, value = write
+            if self._current(key) == value:
+                self._restore(key, previous)
+            raise
+
+    def _restore(self, key: tuple[str, str], value: tuple[float, str] | None) -> None:
+        """Publish new snapshots with *key* set back to *value*."""
+        if value is None:
+            self._drop_overrides({key})
+            return
+        self._symbol_overrides = {**self._symbol_overrides, key: value[0]}
+        self._symbol_sources = {**self._symbol_sources, key: value[1]}
+        self._version += 1
+
+    async def flush_writes(self) -> None:
+        """Wait until every queued override change has been persisted."""
+        if self._writer is not None and not self._writer.done():
+            await self._write_queue.join()
+
+    async def stop(self) -> None:
+        """Persist queued override changes, then stop the background writer."""
+        await self.flush_writes()
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+
+    async def _drain_writes(self) -> None:
+        """Persist queued override changes in batches, one commit per batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+            deadline = loop.time() + _WRITE_BATCH_WINDOW
+            while len(batch) < _WRITE_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._write_queue.get(), remaining)
+                    )
+                except TimeoutError:
+                    break
+
+            try:
+                await self._persist_batch([write for write, _ in batch])
+            except Exception as e:
+                logger.error(
+                    "Failed to persist %d multiplier change(s): %s", len(batch), e
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    async def _persist_batch(self, batch: list[_OverrideWrite]) -> None:
+        """Write a batch of override changes; the last change per key wins."""
+        latest: dict[tuple[str, str], tuple[float, str] | None] = dict(batch)
+        upserts = [
+            {
+                "follower_id": fid,
+                "symbol": sym,
+                "multiplier": value[0],
+                "source": value[1],
+            }
+            for (fid, sym), value in latest.items()
+            if value is not None
+        ]
+        deletes = [key for key, value in latest.items() if value is None]
 
         factory = get_session_factory()
         async with factory() as session:
-            existing = await session.execute(
-                select(SymbolMultiplier).where(
-                    SymbolMultiplier.follower_id == follower_id,
-                    SymbolMultiplier.symbol == symbol,
+            if upserts:
+                stmt = sqlite_insert(SymbolMultiplier).values(upserts)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["follower_id", "symbol"],
+                        set_={
+                            "multiplier": stmt.excluded.multiplier,
+                            "source": stmt.excluded.source,
+                            "updated_at": func.now(),
+                        },
+                    )
                 )
-            )
-            sm = existing.scalar_one_or_none()
-            if sm:
-                await session.delete(sm)
-                await session.commit()
+            if deletes:
+                await session.execute(
+                    delete(SymbolMultiplier).where(
+                        or_(
+                            *(
+                                and_(
+                                    SymbolMultiplier.follower_id == fid,
+                                    SymbolMultiplier.symbol == sym,
+                                )
+                                for fid, sym in deletes
+                            )
+                        )
+                    )
+                )
+            await session.commit()
 
-    def remove_follower(self, follower_id: str) -> None:
-        """Clean up all in-memory state for a removed follower."""
-        self._base_multipliers.pop(follower_id, None)
-        keys_to_remove = [k for k in self._symbol_overrides if k[0] == follower_id]
-        for key in keys_to_remove:
-            self._symbol_overrides.pop(key, None)
-            self._symbol_sources.pop(key, None)
+        logger.debug(
+            "Persisted multiplier batch: %d upsert(s), %d delete(s)",
+            len(upserts),
+            len(deletes),
+        )
 
     def get_all_for_follower(self, follower_id: str) -> dict[str, dict[str, Any]]:
         """Get all multiplier info for a follower (base + overrides)."""
+        overrides = self._symbol_overrides
+        sources = self._symbol_sources
         result: dict[str, dict[str, Any]] = {}
-        for (fid, sym), mult in self._symbol_overrides.items():
+        for (fid, sym), mult in overrides.items():
             if fid == follower_id:
                 result[sym] = {
                     "multiplier": mult,
-                    "source": self._symbol_sources.get((fid, sym), "unknown"),
+                    "source": sources.get((fid, sym), "unknown"),
                 }
         return result
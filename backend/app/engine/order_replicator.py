@@ -5,8 +5,14 @@ Handles replicating order actions (submit, cancel, replace) from master to follo
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
+
 from das_bridge import DASClient
 from das_bridge.domain.orders import (
     BaseOrder,
@@ -25,6 +31,90 @@ from app.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only result for master orders with no tracked follower orders
+_NO_FOLLOWER_ORDERS: Mapping[str, int] = MappingProxyType({})
+
+type _SubmitHandler = Callable[[DASClient, Any, int], Awaitable[OrderResult]]
+
+
+def _start_eager[T](coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Wrap *coro* in a task that runs synchronously up to its first suspension.
+
+    Used for the follower fan-out only: branches that finish without I/O
+    complete without a trip through the ready queue. The loop's own task
+    factory is left alone, so unrelated tasks are unaffected.
+    """
+    return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+
+
+async def _submit_market(
+    client: DASClient, master_order: MarketOrder, quantity: int
+) -> OrderResult:
+    return await client.place_market_order(
+        symbol=master_order.symbol,
+        quantity=quantity,
+        side=master_order.side,
+    )
+
+
+async def _submit_limit(
+    client: DASClient, master_order: LimitOrder, quantity: int
+) -> OrderResult:
+    return await client.place_limit_order(
+        symbol=master_order.symbol,
+        quantity=quantity,
+        side=master_order.side,
+        price=master_order.price,
+    )
+
+
+def _rebuilt_submitter(
+    order_cls: type[BaseOrder], fields: tuple[str, ...]
+) -> _SubmitHandler:
+    """Build a handler that re-creates *order_cls* with the master's *fields*."""
+
+    async def submit(
+        client: DASClient, master_order: BaseOrder, quantity: int
+    ) -> OrderResult:
+        order = order_cls(
+            symbol=master_order.symbol,
+            quantity=quantity,
+            side=master_order.side,
+            **{name: getattr(master_order, name) for name in fields},
+        )
+        return await client.submit_order(order)
+
+    return submit
+
+
+# Order type → coroutine that submits the matching follower order.
+_SUBMIT_HANDLERS: dict[type[BaseOrder], _SubmitHandler] = {
+    MarketOrder: _submit_market,
+    LimitOrder: _submit_limit,
+    StopLimitOrder: _rebuilt_submitter(
+        StopLimitOrder, ("stop_price", "limit_price", "time_in_force")
+    ),
+    StopOrder: _rebuilt_submitter(StopOrder, ("stop_price", "time_in_force")),
+    TrailingStopOrder: _rebuilt_submitter(
+        TrailingStopOrder, ("trail_amount", "time_in_force")
+    ),
+}
+
+
+@functools.cache
+def _submit_handler_for(order_cls: type[BaseOrder]) -> _SubmitHandler | None:
+    """Resolve the submit handler for a concrete order type.
+
+    Walks the MRO so the most specific registered class wins (StopLimitOrder
+    before StopOrder). Cached per type, so each replicated order costs a
+    single dict lookup.
+    """
+    for base in order_cls.__mro__:
+        handler = _SUBMIT_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return None
+
 
 class OrderReplicator:
     """Submits, cancels, and replaces orders on follower accounts.
@@ -32,45 +122,76 @@ class OrderReplicator:
     Based on master order events.
     """
 
+    __slots__ = (
+        "_das",
+        "_multiplier_mgr",
+        "_blacklist_mgr",
+        "_notifier",
+        "_orders",
+        "_master_followers",
+        "_fanout_sem",
+        "_get_follower",
+    )
+
     def __init__(
         self,
         das_service: DASService,
         multiplier_mgr: MultiplierManager,
         blacklist_mgr: BlacklistManager,
         notifier: NotificationService,
+        max_concurrent_ops: int = 8,
     ) -> None:
-        """Initialize the order replicator with its dependencies."""
+        """Initialize the order replicator with its dependencies.
+
+        Args:
+            das_service: DAS connection service.
+            multiplier_mgr: Resolves per-follower quantity multipliers.
+            blacklist_mgr: Per-follower symbol blacklist.
+            notifier: Broadcasts alerts to the UI.
+            max_concurrent_ops: Upper bound on follower DAS calls in flight,
+                so a large fan-out cannot flood the DAS servers.
+        """
         self._das = das_service
         self._multiplier_mgr = multiplier_mgr
         self._blacklist_mgr = blacklist_mgr
         self._notifier = notifier
+        self._fanout_sem = asyncio.Semaphore(max_concurrent_ops)
+        # Bound once: resolves a connected follower client, or None.
+        self._get_follower: Callable[[str], DASClient | None] = (
+            das_service.get_connected_follower
+        )
 
-        # master_order_id → {follower_id: follower_order_id}
-        self._order_map: dict[int, dict[str, int]] = {}
-        # follower_order_id → master_order_id (reverse lookup)
-        self._reverse_map: dict[int, int] = {}
-
-    def _scale_quantity(self, quantity: int, follower_id: str, symbol: str) -> int:
-        """Scale a quantity by the effective multiplier, rounded to int."""
+        # (master_order_id, follower_id) → (follower_order_id, symbol)
+        # The symbol is cached so cancel/replace need not look the order up.
+        self._orders: dict[tuple[int, str], tuple[int, str]] = {}
+        # master_order_id → follower_ids with a tracked order (fan-out index)
+        # Reverse lookups are rare and answered by scanning ``_orders``, so no
+        # follower_order_id → master_order_id index is kept.
+        self._master_followers: dict[int, set[str]] = {}
+
+    def _scale_quantity(
+        self, quantity: int, follower_id: str, symbol: str
+    ) -> tuple[int, float]:
+        """Scale a quantity by the effective multiplier, rounded to int.
+
+        Returns ``(scaled_qty, multiplier)`` so callers can reuse the
+        multiplier without resolving it a second time.
+        """
         multiplier = self._multiplier_mgr.get_effective(follower_id, symbol)
-        source = self._multiplier_mgr.get_source(follower_id, symbol)
         scaled = round(quantity * multiplier)
-        result = max(scaled, 0)  # Non-negative, 0 means skip
-        logger.debug(
-            "Scale qty: follower=%s symbol=%s master_qty=%d "
-            "multiplier=%.4f source=%s -> %d",
-            follower_id,
-            symbol,
-            quantity,
-            multiplier,
-            source,
-            result,
-        )
-        return result
-
-    def _get_follower(self, follower_id: str) -> DASClient | None:
-        """Get a connected follower client, or None."""
-        return self._das.get_connected_follower(follower_id)
+        result = scaled if scaled > 0 else 0  # Non-negative, 0 means skip
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Scale qty: follower=%s symbol=%s master_qty=%d "
+                "multiplier=%.4f source=%s -> %d",
+                follower_id,
+                symbol,
+                quantity,
+                multiplier,
+                self._multiplier_mgr.get_source(follower_id, symbol),
+                result,
+            )
+        return result, multiplier
 
     async def replicate_order(
         self,
@@ -92,7 +213,9 @@ class OrderReplicator:
             return None
 
         symbol = master_order.symbol
-        scaled_qty = self._scale_quantity(master_order.quantity, follower_id, symbol)
+        scaled_qty, multiplier = self._scale_quantity(
+            master_order.quantity, follower_id, symbol
+        )
 
         if scaled_qty == 0:
             logger.info(
@@ -102,17 +225,21 @@ class OrderReplicator:
             )
             return None
 
-        logger.debug(
-            "Submitting %s to %s: symbol=%s side=%s qty=%d",
-            type(master_order).__name__,
-            follower_id,
-            symbol,
-            master_order.side,
-            scaled_qty,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Submitting %s to %s: symbol=%s side=%s qty=%d",
+                type(master_order).__name__,
+                follower_id,
+                symbol,
+                master_order.side,
+                scaled_qty,
+            )
 
         try:
-            result = await self._submit_matching_order(client, master_order, scaled_qty)
+            async with self._fanout_sem:
+                result = await self._submit_matching_order(
+                    client, master_order, scaled_qty
+                )
 
             if result and result.is_rejected:
                 logger.error(
@@ -121,7 +248,7 @@ class OrderReplicator:
                     follower_id,
                     result.message,
                 )
-                await self._notifier.broadcast(
+                self._notifier.enqueue(
                     "alert",
                     {
                         "level": "error",
@@ -137,22 +264,26 @@ class OrderReplicator:
             if result and result.is_success and result.order_id is not None:
                 follower_order_id = result.order_id
                 # Track mapping
-                if master_order_id not in self._order_map:
-                    self._order_map[master_order_id] = {}
-                self._order_map[master_order_id][follower_id] = follower_order_id
-                self._reverse_map[follower_order_id] = master_order_id
-
-                logger.info(
-                    "Replicated %s order to %s: qty=%d (master=%d) "
-                    "master_oid=%s follower_oid=%s multiplier=%.4f",
-                    symbol,
-                    follower_id,
-                    scaled_qty,
-                    master_order.quantity,
-                    master_order_id,
+                self._orders[(master_order_id, follower_id)] = (
                     follower_order_id,
-                    self._multiplier_mgr.get_effective(follower_id, symbol),
+                    symbol,
+                )
+                self._master_followers.setdefault(master_order_id, set()).add(
+                    follower_id
                 )
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Replicated %s order to %s: qty=%d (master=%d) "
+                        "master_oid=%s follower_oid=%s multiplier=%.4f",
+                        symbol,
+                        follower_id,
+                        scaled_qty,
+                        master_order.quantity,
+                        master_order_id,
+                        follower_order_id,
+                        multiplier,
+                    )
                 return follower_order_id
 
             # Unexpected status — not rejected, not successful
@@ -165,7 +296,7 @@ class OrderReplicator:
                 result.order_id if result else None,
                 result.message if result else None,
             )
-            await self._notifier.broadcast(
+            self._notifier.enqueue(
                 "alert",
                 {
                     "level": "warn",
@@ -184,7 +315,7 @@ class OrderReplicator:
                 follower_id,
                 e,
             )
-            await self._notifier.broadcast(
+            self._notifier.enqueue(
                 "alert",
                 {
                     "level": "error",
@@ -207,58 +338,44 @@ class OrderReplicator:
 
         Token generation is handled by das-bridge's OrderManager.
         """
-        symbol = master_order.symbol
-        side = master_order.side
+        handler = _submit_handler_for(type(master_order))
+        if handler is not None:
+            return await handler(client, master_order, quantity)
 
-        if isinstance(master_order, MarketOrder):
-            return await client.place_market_order(
-                symbol=symbol,
-                quantity=quantity,
-                side=side,
-            )
-        elif isinstance(master_order, LimitOrder):
-            return await client.place_limit_order(
-                symbol=symbol,
-                quantity=quantity,
-                side=side,
-                price=master_order.price,
-            )
-        elif isinstance(master_order, StopLimitOrder):
-            # StopLimit must be checked before Stop (inheritance)
-            order = StopLimitOrder(
-                symbol=symbol,
-                quantity=quantity,
-                side=side,
-                stop_price=master_order.stop_price,
-                limit_price=master_order.limit_price,
-                time_in_force=master_order.time_in_force,
-            )
-            return await client.submit_order(order)
-        elif isinstance(master_order, StopOrder):
-            order = StopOrder(
-                symbol=symbol,
-                quantity=quantity,
-                side=side,
-                stop_price=master_order.stop_price,
-                time_in_force=master_order.time_in_force,
-            )
-            return await client.submit_order(order)
-        elif isinstance(master_order, TrailingStopOrder):
-            order = TrailingStopOrder(
-                symbol=symbol,
-                quantity=quantity,
-                side=side,
-                trail_amount=master_order.trail_amount,
-                time_in_force=master_order.time_in_force,
-            )
-            return await client.submit_order(order)
-        else:
-            # For any other order type, try generic submission
-            logger.warning(
-                "Unknown order type %s, attempting generic submit",
-                type(master_order).__name__,
-            )
-            return await client.submit_order(master_order)
+        # For any other order type, try generic submission
+        logger.warning(
+            "Unknown order type %s, attempting generic submit",
+            type(master_order).__name__,
+        )
+        return await client.submit_order(master_order)
+
+    async def replicate_to_all(
+        self,
+        master_order: BaseOrder,
+        master_order_id: int,
+        follower_ids: list[str],
+    ) -> dict[str, int | None]:
+        """Replicate a master order to several followers concurrently.
+
+        A follower whose replication raises is logged and reported as None;
+        the other followers are unaffected.
+        Returns {follower_id: follower_order_id or None}.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                _start_eager(self.replicate_order(master_order, fid, master_order_id))
+                for fid in follower_ids
+            ),
+            return_exceptions=True,
+        )
+        results: dict[str, int | None] = {}
+        for fid, outcome in zip(follower_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("Replication to %s failed: %s", fid, outcome)
+                results[fid] = None
+            else:
+                results[fid] = outcome
+        return results
 
     async def cancel_follower_orders(
         self,
@@ -266,55 +383,60 @@ class OrderReplicator:
     ) -> dict[str, bool]:
         """Cancel all follower orders that correspond to a master order.
 
+        Followers are cancelled concurrently.
         Returns {follower_id: success_bool}.
         """
-        follower_ids = self._order_map.get(master_order_id, {})
-        results: dict[str, bool] = {}
-
-        for follower_id, follower_order_id in follower_ids.items():
-            client = self._get_follower(follower_id)
-            if not client:
-                results[follower_id] = False
-                continue
+        follower_orders = self._follower_orders(master_order_id)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._cancel_one(fid, oid, sym))
+                for fid, oid, sym in follower_orders
+            ]
+        return {
+            fid: task.result()
+            for (fid, _, _), task in zip(follower_orders, tasks, strict=True)
+        }
+
+    async def _cancel_one(
+        self, follower_id: str, follower_order_id: int, symbol: str
+    ) -> bool:
+        """Cancel a single follower order. Returns True on success."""
+        client = self._get_follower(follower_id)
+        if not client:
+            return False
 
-            try:
+        try:
+            async with self._fanout_sem:
                 success = await client.cancel_order(follower_order_id)
-                results[follower_id] = success
-                order = client.get_order(follower_order_id)
-                symbol = order.symbol if order else "UNKNOWN"
-                if success:
-                    logger.info(
-                        "Cancelled %s order on %s (follower_oid=%s)",
-                        symbol,
-                        follower_id,
-                        follower_order_id,
-                    )
-                else:
-                    logger.warning(
-                        "Cancel failed for %s order on %s (follower_oid=%s)",
-                        symbol,
-                        follower_id,
-                        follower_order_id,
-                    )
-                    await self._notifier.broadcast(
-                        "alert",
-                        {
-                            "level": "warn",
-                            "message": (
-                                f"Cancel failed for {symbol}"
-                                f" on {follower_id}"
-                            ),
-                        },
-                    )
-            except Exception as e:
-                results[follower_id] = False
-                logger.error(
-                    "Failed to cancel order on %s: %s",
+            if success:
+                logger.info(
+                    "Cancelled %s order on %s (follower_oid=%s)",
+                    symbol,
                     follower_id,
-                    e,
+                    follower_order_id,
                 )
-
-        return results
+            else:
+                logger.warning(
+                    "Cancel failed for %s order on %s (follower_oid=%s)",
+                    symbol,
+                    follower_id,
+                    follower_order_id,
+                )
+                self._notifier.enqueue(
+                    "alert",
+                    {
+                        "level": "warn",
+                        "message": f"Cancel failed for {symbol} on {follower_id}",
+                    },
+                )
+            return success
+        except Exception as e:
+            logger.error(
+                "Failed to cancel order on %s: %s",
+                follower_id,
+                e,
+            )
+            return False
 
     async def replace_follower_orders(
         self,
@@ -324,86 +446,118 @@ class OrderReplicator:
     ) -> dict[str, bool]:
         """Replace all follower orders corresponding to a master order.
 
-        Scales quantity but preserves price from master.
+        Scales quantity but preserves price from master. Followers are
+        replaced concurrently.
         Returns {follower_id: success_bool}.
         """
-        follower_ids = self._order_map.get(master_order_id, {})
-        results: dict[str, bool] = {}
-
-        for follower_id, follower_order_id in follower_ids.items():
-            client = self._get_follower(follower_id)
-            if not client:
-                results[follower_id] = False
-                continue
+        follower_orders = self._follower_orders(master_order_id)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self._replace_one(fid, oid, sym, new_quantity, new_price)
+                )
+                for fid, oid, sym in follower_orders
+            ]
+        return {
+            fid: task.result()
+            for (fid, _, _), task in zip(follower_orders, tasks, strict=True)
+        }
+
+    async def _replace_one(
+        self,
+        follower_id: str,
+        follower_order_id: int,
+        symbol: str,
+        new_quantity: int | None,
+        new_price: Decimal | None,
+    ) -> bool:
+        """Replace a single follower order. Returns True on success."""
+        client = self._get_follower(follower_id)
+        if not client:
+            return False
 
-            try:
+        try:
+            # Scale the new quantity; only keeping the current quantity
+            # needs the live order.
+            if new_quantity is not None:
+                scaled_qty, _ = self._scale_quantity(new_quantity, follower_id, symbol)
+            else:
                 order = client.get_order(follower_order_id)
                 if not order:
-                    results[follower_id] = False
-                    continue
-
-                # Scale the new quantity
+                    return False
                 scaled_qty = order.quantity
-                if new_quantity is not None:
-                    scaled_qty = self._scale_quantity(
-                        new_quantity, follower_id, order.symbol
-                    )
 
+            async with self._fanout_sem:
                 success = await client.replace_order(
                     follower_order_id,
                     new_quantity=scaled_qty,
                     new_price=new_price,
                 )
-                results[follower_id] = success
 
-                if success:
-                    logger.info(
-                        "Replaced %s order on %s: qty=%d price=%s",
-                        order.symbol,
-                        follower_id,
-                        scaled_qty,
-                        new_price,
-                    )
-                else:
-                    logger.warning(
-                        "Replace failed for %s order on %s "
-                        "(follower_oid=%s qty=%d price=%s)",
-                        order.symbol,
-                        follower_id,
-                        follower_order_id,
-                        scaled_qty,
-                        new_price,
-                    )
-                    await self._notifier.broadcast(
-                        "alert",
-                        {
-                            "level": "warn",
-                            "message": (
-                                f"Replace failed for {order.symbol}"
-                                f" on {follower_id}"
-                            ),
-                        },
-                    )
-            except Exception as e:
-                results[follower_id] = False
-                logger.error(
-                    "Failed to replace order on %s: %s",
+            if success:
+                logger.info(
+                    "Replaced %s order on %s: qty=%d price=%s",
+                    symbol,
                     follower_id,
-                    e,
+                    scaled_qty,
+                    new_price,
                 )
+            else:
+                logger.warning(
+                    "Replace failed for %s order on %s "
+                    "(follower_oid=%s qty=%d price=%s)",
+                    symbol,
+                    follower_id,
+                    follower_order_id,
+                    scaled_qty,
+                    new_price,
+                )
+                self._notifier.enqueue(
+                    "alert",
+                    {
+                        "level": "warn",
+                        "message": f"Replace failed for {symbol} on {follower_id}",
+                    },
+                )
+            return success
+        except Exception as e:
+            logger.error(
+                "Failed to replace order on %s: %s",
+                follower_id,
+                e,
+            )
+            return False
+
+    def _follower_orders(self, master_order_id: int) -> list[tuple[str, int, str]]:
+        """Return ``(follower_id, follower_order_id, symbol)`` for a master order."""
+        orders = self._orders
+        return [
+            (fid, *orders[(master_order_id, fid)])
+            for fid in self._master_followers.get(master_order_id, ())
+        ]
+
+    def get_follower_order_ids(self, master_order_id: int) -> Mapping[str, int]:
+        """Get all follower order IDs for a master order (read-only)."""
+        follower_ids = self._master_followers.get(master_order_id)
+        if not follower_ids:
+            return _NO_FOLLOWER_ORDERS
+        orders = self._orders
+        return {fid: orders[(master_order_id, fid)][0] for fid in follower_ids}
+
+    def get_master_order_id(
+        self, follower_order_id: int, follower_id: str | None = None
+    ) -> int | None:
+        """Reverse lookup: follower order_id → master order_id.
 
-        return results
-
-    def get_follower_order_ids(self, master_order_id: int) -> dict[str, int]:
-        """Get all follower order IDs for a master order."""
-        return dict(self._order_map.get(master_order_id, {}))
-
-    def get_master_order_id(self, follower_order_id: int) -> int | None:
-        """Reverse lookup: follower order_id → master order_id."""
-        return self._reverse_map.get(follower_order_id)
+        Follower order IDs are assigned per DAS account, so pass
+        *follower_id* to disambiguate when several followers are tracked.
+        """
+        for (master_order_id, fid), (oid, _) in self._orders.items():
+            if oid == follower_order_id and follower_id in (None, fid):
+                return master_order_id
+        return None
 
     def cleanup_order(self, master_order_id: int) -> None:
         """Remove tracking for a completed/cancelled master order."""
-        follower_ids = self._order_map.pop(master_order_id, {})
-        for oid in follower_ids.values():
-            self._reverse_map.pop(oid, None)
+        for fid in self._master_followers.pop(master_order_id, ()):
+            self._orders.pop((master_order_id, fid), None)
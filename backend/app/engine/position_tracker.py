@@ -7,15 +7,60 @@ master and follower DAS clients.
 from __future__ import annotations
 
 import logging
+import operator
 from typing import Any
 
-from das_bridge.domain.positions import Position
-
 from app.engine.multiplier_manager import MultiplierManager
 from app.services.das_service import DASService
 
 logger = logging.getLogger(__name__)
 
+# position_type enum member → its name; the enum has only a few members, so
+# this stays tiny and saves an enum descriptor lookup per serialized row.
+_POSITION_SIDE_NAMES: dict[Any, str] = {}
+
+
+def _position_side(position_type: Any) -> str:
+    """Return the side name for a position type, memoized by member."""
+    name = _POSITION_SIDE_NAMES.get(position_type)
+    if name is None:
+        name = _POSITION_SIDE_NAMES[position_type] = getattr(
+            position_type, "name", str(position_type)
+        )
+    return name
+
+
+# Raw position fields the snapshot depends on; compared to detect changes.
+_position_state = operator.attrgetter(
+    "symbol",
+    "position_type",
+    "quantity",
+    "avg_cost",
+    "realized_pnl",
+    "unrealized_pnl",
+    "last_price",
+)
+
+
+type _PositionState = tuple[Any, ...]
+
+
+def _position_row(state: _PositionState) -> dict[str, Any]:
+    """Convert a raw position state tuple to a JSON-serializable dict."""
+    symbol, position_type, quantity, avg_cost, realized, unrealized, last_price = state
+    real = float(realized)
+    unreal = float(unrealized)
+    return {
+        "symbol": symbol,
+        "side": _position_side(position_type),
+        "quantity": quantity,
+        "avg_cost": float(avg_cost),
+        "realized_pnl": real,
+        "unrealized_pnl": unreal,
+        "total_pnl": real + unreal,
+        "last_price": float(last_price or 0),
+    }
+
 
 class PositionTracker:
     """Reads positions from DAS clients and enriches them with multiplier info."""
@@ -29,46 +74,76 @@ class PositionTracker:
         self._das = das_service
         self._multiplier_mgr = multiplier_mgr
 
-    @staticmethod
-    def _serialize_position(pos: Position) -> dict[str, Any]:
-        """Convert a DAS position object to a JSON-serializable dict."""
-        unrealized = float(pos.unrealized_pnl)
-        realized = float(pos.realized_pnl)
-        return {
-            "symbol": pos.symbol,
-            "side": pos.position_type.name,
-            "quantity": pos.quantity,
-            "avg_cost": float(pos.avg_cost),
-            "realized_pnl": realized,
-            "unrealized_pnl": unrealized,
-            "total_pnl": realized + unrealized,
-            "last_price": float(pos.last_price) if pos.last_price else 0,
-        }
+        # Last snapshot and the input state it was built from
+        self._snapshot_key: tuple[Any, ...] | None = None
+        self._snapshot: dict[str, Any] = {"master": [], "followers": {}}
+
+        # Serialized rows from the last snapshot, keyed by the position state
+        # (plus multiplier and source for follower rows). Positions that did
+        # not change since the previous snapshot reuse their row as-is.
+        self._master_rows: dict[_PositionState, dict[str, Any]] = {}
+        self._follower_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
 
     def get_positions_snapshot(self) -> dict[str, Any]:
-        """Build a snapshot of all positions for the dashboard."""
-        snapshot: dict[str, Any] = {"master": [], "followers": {}}
+        """Build a snapshot of all positions for the dashboard.
 
+        The previous snapshot is returned as-is when neither the raw position
+        fields nor any multiplier changed since it was built.
+        """
         master_client = self._das.master_client
-        if master_client and master_client.is_running:
-            for pos in master_client.positions:
-                snapshot["master"].append(self._serialize_position(pos))
-
-        for fid, client in self._das.follower_clients.items():
-            if not client.is_running:
-                snapshot["followers"][fid] = []
-                continue
-
-            positions: list[dict[str, Any]] = []
-            for pos in client.positions:
-                entry = self._serialize_position(pos)
-                entry["effective_multiplier"] = self._multiplier_mgr.get_effective(
-                    fid, pos.symbol
-                )
-                entry["multiplier_source"] = self._multiplier_mgr.get_source(
-                    fid, pos.symbol
-                )
-                positions.append(entry)
-            snapshot["followers"][fid] = positions
+        master_states: tuple[_PositionState, ...] = (
+            tuple(map(_position_state, master_client.positions))
+            if master_client and master_client.is_running
+            else ()
+        )
+        running = self._das.running_follower_clients()
+        follower_states: tuple[tuple[str, tuple[_PositionState, ...]], ...] = tuple(
+            (fid, tuple(map(_position_state, client.positions)))
+            for fid, client in running.items()
+        )
+        # Known-but-disconnected followers only need an empty entry.
+        stopped = tuple(fid for fid in self._das.follower_ids if fid not in running)
+
+        key = (self._multiplier_mgr.version, master_states, follower_states, stopped)
+        if key == self._snapshot_key:
+            return self._snapshot
+
+        multipliers = self._multiplier_mgr.get_effective_bulk(
+            (fid, state[0]) for fid, states in follower_states for state in states
+        )
+
+        prev_master_rows = self._master_rows
+        master_rows: dict[_PositionState, dict[str, Any]] = {}
+        master: list[dict[str, Any]] = []
+        for state in master_states:
+            row = prev_master_rows.get(state)
+            if row is None:
+                row = _position_row(state)
+            master_rows[state] = row
+            master.append(row)
+
+        prev_follower_rows = self._follower_rows
+        follower_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+        followers: dict[str, list[dict[str, Any]]] = {}
+        for fid, states in follower_states:
+            rows: list[dict[str, Any]] = []
+            for state in states:
+                multiplier, source = multipliers[(fid, state[0])]
+                row_key = (fid, state, multiplier, source)
+                row = prev_follower_rows.get(row_key)
+                if row is None:
+                    row = _position_row(state)
+                    row["effective_multiplier"] = multiplier
+                    row["multiplier_source"] = source
+                follower_rows[row_key] = row
+                rows.append(row)
+            followers[fid] = rows
+        for fid in stopped:
+            followers[fid] = []
 
+        snapshot: dict[str, Any] = {"master": master, "followers": followers}
+        self._master_rows = master_rows
+        self._follower_rows = follower_rows
+        self._snapshot_key = key
+        self._snapshot = snapshot
         return snapshot
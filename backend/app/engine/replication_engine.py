@@ -7,9 +7,14 @@ to all follower accounts through the specialized sub-engines.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
-from collections.abc import Callable, Coroutine
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Mapping
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 from das_bridge import DASClient
@@ -18,8 +23,17 @@ from das_bridge.domain.events.order_events import (
     OrderCancelledEvent,
     OrderReplacedEvent,
 )
-
-from app.engine.action_queue import ActionQueue, QueuedAction, QueuedActionType
+from das_bridge.domain.orders import BaseOrder
+
+from app.config import get_config
+from app.engine.action_queue import (
+    ActionQueue,
+    CancelPayload,
+    QueuedAction,
+    QueuedActionType,
+    ReplacePayload,
+    SubmitPayload,
+)
 from app.engine.blacklist_manager import BlacklistManager
 from app.engine.multiplier_manager import MultiplierManager
 from app.engine.order_replicator import OrderReplicator
@@ -31,29 +45,55 @@ from app.services.notification_service import NotificationService
 logger = logging.getLogger(__name__)
 
 
-def _log_task_exception(task: asyncio.Task[Any]) -> None:
-    """Log unhandled exceptions from fire-and-forget event handlers."""
-    if task.cancelled():
-        return
-    exc = task.exception()
-    if exc is not None:
-        logger.error(
-            "Unhandled exception in event handler: %s",
-            exc,
-            exc_info=(type(exc), exc, exc.__traceback__),
-        )
+# Number of worker tasks draining the master event queue
+_EVENT_WORKERS = 4
+# How long stop() lets the workers finish events already queued
+_EVENT_DRAIN_TIMEOUT = 10.0  # seconds
+
+# State push cadence: a push follows a change after the coalesce window, and
+# the state is re-polled at the fallback interval for changes with no event
+# (position ticks, follower connectivity).
+_STATE_PUSH_COALESCE = 0.25  # seconds
+_STATE_PUSH_INTERVAL = 1.0  # seconds
+# An unchanged state is still re-sent this often as a UI heartbeat
+_STATE_HEARTBEAT_INTERVAL = 5.0  # seconds
+# A push iteration slower than this is logged with a per-step breakdown
+_STATE_PUSH_SLOW = 0.5  # seconds
+# Shared read-only default for followers without a stored config
+_NO_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Max queued-action chains replayed concurrently
+_REPLAY_CONCURRENCY = 16
+
+# Reconnect detection cadence while no UI client is connected
+_IDLE_RECONNECT_CHECK_INTERVAL = 5.0  # seconds
+
+# DAS Bridge server-status probe orders are sent as SPY via TESTROUTE
+_PROBE_SYMBOL = "SPY"
+_PROBE_ROUTE = "TESTROUTE"
+# Probe order IDs are forgotten after this long (their events arrive within
+# seconds; the TTL only bounds probes that never get a cancel)
+_PROBE_ORDER_TTL = 600.0  # seconds
+
+type _EventHandler = Callable[[Any], Coroutine[Any, Any, None]]
 
 
-def _fire[E](
-    coro_fn: Callable[[E], Coroutine[Any, Any, None]],
-) -> Callable[[E], None]:
-    """Wrap an async handler so it can be passed to ``DASClient.on()``."""
+# Enum member → str(member). Order sides and statuses have only a handful of
+# members, so this stays tiny and skips ``Enum.__str__`` on every use.
+_ENUM_TEXT: dict[Any, str] = {}
 
-    def wrapper(event: E) -> None:
-        task = asyncio.ensure_future(coro_fn(event))
-        task.add_done_callback(_log_task_exception)
 
-    return wrapper
+def _enum_text(value: Any) -> str:
+    """Return ``str(value)`` for an enum member, memoized by member."""
+    text = _ENUM_TEXT.get(value)
+    if text is None:
+        text = _ENUM_TEXT[value] = str(value)
+    return text
+
+
+def _is_probe_order(order: BaseOrder) -> bool:
+    """Return True for a DAS Bridge server-status probe order."""
+    return order.symbol == _PROBE_SYMBOL and order.route == _PROBE_ROUTE
 
 
 class ReplicationEngine:
@@ -80,6 +120,7 @@ class ReplicationEngine:
             self._multiplier_mgr,
             self._blacklist_mgr,
             notifier,
+            max_concurrent_ops=get_config().max_concurrent_follower_ops,
         )
         self._short_sale_mgr = ShortSaleManager(
             das_service,
@@ -87,6 +128,7 @@ class ReplicationEngine:
             self._blacklist_mgr,
             self._order_replicator,
             notifier,
+            max_concurrent_locates=get_config().max_concurrent_locates,
         )
         self._position_tracker = PositionTracker(
             das_service,
@@ -94,10 +136,12 @@ class ReplicationEngine:
         )
 
         # Disconnected-follower action queue
-        self._action_queue = ActionQueue()
+        self._action_queue = ActionQueue(
+            max_per_follower=get_config().action_queue_max_per_follower
+        )
 
-        # Event unsubscribe callbacks
-        self._unsubscribers: list[Callable[[], None]] = []
+        # Event unsubscribe callbacks, run in reverse order on close()
+        self._subscriptions = contextlib.ExitStack()
         self._running = False
 
         # Follower configs cache (loaded from DB)
@@ -105,9 +149,24 @@ class ReplicationEngine:
 
         # State push task
         self._state_push_task: asyncio.Task[None] | None = None
+        # Set when engine state changed and the UI should be pushed early
+        self._state_dirty = asyncio.Event()
+        # Last full state built and its per-order rows, reused while unchanged
+        self._full_state: dict[str, Any] | None = None
+        self._master_order_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+        # Master events are queued by the DAS callbacks and handled by a small
+        # pool of long-lived workers instead of one task per event.
+        self._event_queue: asyncio.Queue[tuple[_EventHandler, Any]] = asyncio.Queue()
+        self._event_workers: list[asyncio.Task[None]] = []
 
-        # Reconnect detection: track previous ``is_running`` per follower
-        self._prev_follower_connected: dict[str, bool] = {}
+        # Reconnect detection: followers that were connected on the last check
+        self._connected_followers: set[str] = set()
+
+        # Master order IDs seen to be probe orders → time seen (oldest first).
+        # Later events for them are dropped by ID, before the order is looked
+        # up. Entries expire after _PROBE_ORDER_TTL.
+        self._probe_order_ids: OrderedDict[int, float] = OrderedDict()
 
     @property
     def follower_configs(self) -> dict[str, dict[str, Any]]:
@@ -149,6 +208,13 @@ class ReplicationEngine:
         """Return whether the replication engine is actively running."""
         return self._running
 
+    async def load_persistent_state(self) -> None:
+        """Load multipliers and blacklist from the DB concurrently."""
+        await asyncio.gather(
+            self._multiplier_mgr.load_from_db(),
+            self._blacklist_mgr.load_from_db(),
+        )
+
     async def start(
         self,
         follower_configs: dict[str, dict[str, Any]] | None = None,
@@ -167,12 +233,23 @@ class ReplicationEngine:
             return
 
         if load_persistent_state:
-            await self._multiplier_mgr.load_from_db()
-            await self._blacklist_mgr.load_from_db()
+            await self.load_persistent_state()
 
         if follower_configs:
             self._follower_configs = follower_configs
 
+        # Pick up a locate cap changed via the env config since the last run
+        await self._short_sale_mgr.set_max_concurrent_locates(
+            get_config().max_concurrent_locates
+        )
+
+        # Fresh queue: nothing left over from a previous run is replayed
+        self._event_queue = asyncio.Queue()
+        self._event_workers = [
+            asyncio.create_task(self._event_worker(), name=f"engine-events-{i}")
+            for i in range(_EVENT_WORKERS)
+        ]
+
         # Subscribe to master events
         master = self._das.master_client
         if master:
@@ -189,6 +266,25 @@ class ReplicationEngine:
         if not self._running:
             return
 
+        # Unsubscribe from events, then let the workers finish what is already
+        # queued so no fan-out is cut off between submit and bookkeeping
+        self._subscriptions.close()
+        try:
+            await asyncio.wait_for(self._event_queue.join(), _EVENT_DRAIN_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                "Event workers still busy after %.0fs; dropping %d queued event(s)",
+                _EVENT_DRAIN_TIMEOUT,
+                self._event_queue.qsize(),
+            )
+        for worker in self._event_workers:
+            worker.cancel()
+        await asyncio.gather(*self._event_workers, return_exceptions=True)
+        self._event_workers.clear()
+        # Anything still queued is dropped, not carried into the next start()
+        self._event_queue = asyncio.Queue()
+        self._probe_order_ids.clear()
+
         # Cancel state push
         if self._state_push_task:
             self._state_push_task.cancel()
@@ -200,31 +296,78 @@ class ReplicationEngine:
         # Cancel in-flight short sale tasks
         await self._short_sale_mgr.cancel_all()
 
-        # Unsubscribe from events
-        for unsub in self._unsubscribers:
-            if callable(unsub):
-                unsub()
-        self._unsubscribers.clear()
+        # Make sure queued multiplier overrides reach the DB, then stop the writer
+        await self._multiplier_mgr.stop()
 
         self._running = False
         logger.info("Replication engine stopped")
 
+    def _remember_probe(self, master_order_id: int) -> None:
+        """Record a probe order ID and forget those older than the TTL."""
+        now = time.monotonic()
+        probes = self._probe_order_ids
+        probes[master_order_id] = now
+        probes.move_to_end(master_order_id)
+        cutoff = now - _PROBE_ORDER_TTL
+        while next(iter(probes.values())) < cutoff:
+            probes.popitem(last=False)
+
     def _subscribe_to_master(self, master: DASClient) -> None:
         """Subscribe to master order/locate events."""
-        # Order accepted → replicate to followers
-        unsub = master.on(OrderAcceptedEvent, _fire(self._on_master_order_accepted))
-        self._unsubscribers.append(unsub)
+        # Subscriptions made here are undone if a later one fails.
+        with contextlib.ExitStack() as stack:
+            # Order accepted → replicate to followers
+            stack.callback(
+                master.on(
+                    OrderAcceptedEvent, self._fire(self._on_master_order_accepted)
+                )
+            )
 
-        # Order cancelled → cancel follower orders
-        unsub = master.on(OrderCancelledEvent, _fire(self._on_master_order_cancelled))
-        self._unsubscribers.append(unsub)
+            # Order cancelled → cancel follower orders
+            stack.callback(
+                master.on(
+                    OrderCancelledEvent, self._fire(self._on_master_order_cancelled)
+                )
+            )
 
-        # Order replaced → replace follower orders
-        unsub = master.on(OrderReplacedEvent, _fire(self._on_master_order_replaced))
-        self._unsubscribers.append(unsub)
+            # Order replaced → replace follower orders
+            stack.callback(
+                master.on(
+                    OrderReplacedEvent, self._fire(self._on_master_order_replaced)
+                )
+            )
+
+            self._subscriptions.enter_context(stack.pop_all())
 
         logger.info("Subscribed to master events")
 
+    def _fire[E](
+        self, coro_fn: Callable[[E], Coroutine[Any, Any, None]]
+    ) -> Callable[[E], None]:
+        """Wrap an async handler so it can be passed to ``DASClient.on()``.
+
+        The wrapper only queues the event; an event worker runs the handler.
+        """
+        return functools.partial(self._enqueue_event, coro_fn)
+
+    def _enqueue_event(self, handler: _EventHandler, event: Any) -> None:
+        """Queue *event* for *handler* on the event workers."""
+        self._event_queue.put_nowait((handler, event))
+
+    async def _event_worker(self) -> None:
+        """Run queued master event handlers until cancelled."""
+        queue = self._event_queue
+        while True:
+            handler, event = await queue.get()
+            try:
+                await handler(event)
+            except Exception as exc:
+                logger.error(
+                    "Unhandled exception in event handler: %s", exc, exc_info=True
+                )
+            finally:
+                queue.task_done()
+
     # --- Master event handlers ---
 
     async def _on_master_order_accepted(self, event: OrderAcceptedEvent) -> None:
@@ -240,30 +383,39 @@ class ReplicationEngine:
             return
 
         # Skip DAS Bridge server-status probe orders (SPY via TESTROUTE)
-        if order.symbol == "SPY" and order.route == "TESTROUTE":
+        if _is_probe_order(order):
+            self._remember_probe(master_order_id)
             logger.debug("Ignoring probe order %s (SPY/TESTROUTE)", master_order_id)
             return
 
+        symbol = order.symbol
+        order_type = type(order).__name__
         logger.info(
             "Master order ACCEPTED: id=%s symbol=%s side=%s qty=%d type=%s route=%s",
             master_order_id,
-            order.symbol,
+            symbol,
             order.side,
             order.quantity,
-            type(order).__name__,
-            getattr(order, "route", "N/A"),
+            order_type,
+            order.route,
         )
 
         followers = self._das.follower_clients
         results: dict[str, int | None] = {}
+        # Per-follower DAS work is independent, so it is collected here and
+        # awaited concurrently after the loop.
+        submit_fids: list[str] = []
+        side_effects: list[Coroutine[Any, Any, Any]] = []
+        queued: list[dict[str, Any]] = []
+        blacklisted = self._blacklist_mgr.blacklisted_for(symbol)
 
         for fid, client in followers.items():
             # Skip blacklisted
-            if self._blacklist_mgr.is_blacklisted(fid, order.symbol):
+            if fid in blacklisted:
                 logger.debug(
                     "Skipping follower %s for %s: symbol is blacklisted",
                     fid,
-                    order.symbol,
+                    symbol,
                 )
                 continue
             # If disconnected → queue the action for later replay
@@ -271,26 +423,23 @@ class ReplicationEngine:
                 self._action_queue.enqueue(
                     follower_id=fid,
                     action_type=QueuedActionType.ORDER_SUBMIT,
-                    symbol=order.symbol,
-                    payload={
-                        "master_order_id": master_order_id,
-                    },
+                    symbol=symbol,
+                    payload=SubmitPayload(master_order_id),
                 )
                 logger.warning(
                     "Follower %s offline — queued replication of %s",
                     fid,
-                    order.symbol,
+                    symbol,
                 )
-                await self._notifier.broadcast(
-                    "action_queued",
+                queued.append(
                     {
                         "follower_id": fid,
                         "action_type": "order_submit",
-                        "symbol": order.symbol,
+                        "symbol": symbol,
                         "message": (
-                            f"Follower {fid} offline — order for {order.symbol} queued"
+                            f"Follower {fid} offline — order for {symbol} queued"
                         ),
-                    },
+                    }
                 )
                 results[fid] = None
                 continue
@@ -298,30 +447,48 @@ class ReplicationEngine:
             # Short sales go through the ShortSaleManager which
             # checks capacity and auto-locates before placing the order.
             if order.is_short:
-                config = self._follower_configs.get(fid, {})
-                await self._short_sale_mgr.handle_short_sale(
-                    master_order=order,
-                    follower_id=fid,
-                    master_order_id=master_order_id,
-                    follower_config=config,
+                config = self._follower_configs.get(fid, _NO_CONFIG)
+                side_effects.append(
+                    self._short_sale_mgr.handle_short_sale(
+                        master_order=order,
+                        follower_id=fid,
+                        master_order_id=master_order_id,
+                        follower_config=config,
+                    )
                 )
                 results[fid] = None  # reported asynchronously
                 continue
 
-            follower_oid = await self._order_replicator.replicate_order(
-                order, fid, master_order_id=master_order_id
-            )
-            results[fid] = follower_oid
+            submit_fids.append(fid)
+
+        self._announce_queued(symbol, queued)
+
+        replicated, *outcomes = await asyncio.gather(
+            self._order_replicator.replicate_to_all(
+                order, master_order_id, submit_fids
+            ),
+            *side_effects,
+            return_exceptions=True,
+        )
+        if isinstance(replicated, BaseException):
+            logger.error("Replication of %s failed: %s", master_order_id, replicated)
+            results.update(dict.fromkeys(submit_fids))
+        else:
+            results.update(replicated)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error("Follower fan-out step failed: %s", outcome)
 
         # Notify UI
+        self._mark_dirty()
         await self._notifier.broadcast(
             "order_replicated",
             {
-                "symbol": order.symbol,
+                "symbol": symbol,
                 "master_order_id": master_order_id,
-                "side": str(order.side),
+                "side": _enum_text(order.side),
                 "quantity": order.quantity,
-                "type": type(order).__name__,
+                "type": order_type,
                 "follower_results": {
                     fid: {"order_id": oid, "success": oid is not None}
                     for fid, oid in results.items()
@@ -331,15 +498,19 @@ class ReplicationEngine:
 
     async def _on_master_order_cancelled(self, event: OrderCancelledEvent) -> None:
         """Master order cancelled → cancel corresponding follower orders."""
+        master_order_id = event.order_id
+        if self._probe_order_ids.pop(master_order_id, None) is not None:
+            logger.debug("Ignoring probe cancel %s (SPY/TESTROUTE)", master_order_id)
+            return
+
         master = self._das.master_client
         if not master:
             return
 
-        master_order_id = event.order_id
         order = master.get_order(master_order_id)
 
-        # Skip DAS Bridge server-status probe orders (SPY via TESTROUTE)
-        if order and order.symbol == "SPY" and order.route == "TESTROUTE":
+        # Probe orders accepted before the engine started are only known here
+        if order and _is_probe_order(order):
             logger.debug("Ignoring probe cancel %s (SPY/TESTROUTE)", master_order_id)
             return
 
@@ -360,16 +531,16 @@ class ReplicationEngine:
             )
 
         # Queue cancels for disconnected followers
+        queued: list[dict[str, Any]] = []
         for fid, client in self._das.follower_clients.items():
             if not client.is_running:
                 self._action_queue.enqueue(
                     follower_id=fid,
                     action_type=QueuedActionType.ORDER_CANCEL,
                     symbol=symbol,
-                    payload={"master_order_id": master_order_id},
+                    payload=CancelPayload(master_order_id),
                 )
-                await self._notifier.broadcast(
-                    "action_queued",
+                queued.append(
                     {
                         "follower_id": fid,
                         "action_type": "order_cancel",
@@ -377,14 +548,17 @@ class ReplicationEngine:
                         "message": (
                             f"Follower {fid} offline — cancel for {symbol} queued"
                         ),
-                    },
+                    }
                 )
 
+        self._announce_queued(symbol, queued)
+
         results = await self._order_replicator.cancel_follower_orders(master_order_id)
 
         # Cancel any in-flight short sale tasks for this master order
         await self._short_sale_mgr.on_master_order_cancelled(master_order_id)
 
+        self._mark_dirty()
         await self._notifier.broadcast(
             "order_cancelled",
             {
@@ -395,39 +569,40 @@ class ReplicationEngine:
 
     async def _on_master_order_replaced(self, event: OrderReplacedEvent) -> None:
         """Master order replaced → replace corresponding follower orders."""
+        master_order_id = event.order_id
+        if master_order_id in self._probe_order_ids:
+            return
+
         master = self._das.master_client
         if not master:
             return
 
-        master_order_id = event.order_id
         order = master.get_order(master_order_id)
         if not order:
             logger.warning("Master order %s not found for replace", master_order_id)
             return
 
+        # Only priced order types carry ``price``; read it once.
+        price: Decimal | None = getattr(order, "price", None)
         logger.info(
             "Master order REPLACED: id=%s symbol=%s new_qty=%d new_price=%s",
             master_order_id,
             order.symbol,
             order.quantity,
-            getattr(order, "price", "N/A"),
+            "N/A" if price is None else price,
         )
 
         # Queue replaces for disconnected followers
+        queued: list[dict[str, Any]] = []
         for fid, client in self._das.follower_clients.items():
             if not client.is_running:
                 self._action_queue.enqueue(
                     follower_id=fid,
                     action_type=QueuedActionType.ORDER_REPLACE,
                     symbol=order.symbol,
-                    payload={
-                        "master_order_id": master_order_id,
-                        "new_quantity": order.quantity,
-                        "new_price": str(getattr(order, "price", "")),
-                    },
+                    payload=ReplacePayload(master_order_id, order.quantity, price),
                 )
-                await self._notifier.broadcast(
-                    "action_queued",
+                queued.append(
                     {
                         "follower_id": fid,
                         "action_type": "order_replace",
@@ -436,15 +611,18 @@ class ReplicationEngine:
                             f"Follower {fid} offline"
                             f" — replace for {order.symbol} queued"
                         ),
-                    },
+                    }
                 )
 
+        self._announce_queued(order.symbol, queued)
+
         results = await self._order_replicator.replace_follower_orders(
             master_order_id,
             new_quantity=order.quantity,
-            new_price=getattr(order, "price", None),
+            new_price=price,
         )
 
+        self._mark_dirty()
         await self._notifier.broadcast(
             "order_replaced",
             {
@@ -453,26 +631,96 @@ class ReplicationEngine:
             },
         )
 
+    def _announce_queued(self, symbol: str, entries: list[dict[str, Any]]) -> None:
+        """Announce all actions queued for one master event in one message.
+
+        Queued on the notifier without awaiting, so the handler moves on to
+        the connected followers straight away.
+        """
+        if entries:
+            self._notifier.enqueue(
+                "actions_queued", {"symbol": symbol, "entries": entries}
+            )
+        for fid in self._action_queue.take_overflowed():
+            self._notifier.enqueue(
+                "alert",
+                {
+                    "level": "warn",
+                    "message": (
+                        f"Action queue for {fid} is full — oldest queued"
+                        " actions are being dropped"
+                    ),
+                },
+            )
+
     # --- State push loop ---
 
+    def _mark_dirty(self) -> None:
+        """Request an early state push after an engine-side change."""
+        self._state_dirty.set()
+
     async def _state_push_loop(self) -> None:
-        """Periodically push full state to all connected WebSocket clients.
+        """Push full state to all connected WebSocket clients.
 
-        Also detects follower reconnections and notifies the UI about
-        queued actions that are ready for replay.
+        Pushes shortly after a change is flagged via ``_mark_dirty`` (bursts
+        are coalesced) and otherwise polls at the fallback interval. A state
+        identical to the last one pushed is skipped unless a client joined or
+        the heartbeat interval passed. Also detects follower reconnections and
+        notifies the UI about queued actions that are ready for replay.
         """
+        dirty = self._state_dirty
+        loop = asyncio.get_running_loop()
+        next_idle_check = 0.0
+        pushed_state: dict[str, Any] | None = None
+        pushed_generation = -1
+        next_heartbeat = 0.0
         while True:
             try:
-                await asyncio.sleep(1.0)  # 1Hz update rate
+                try:
+                    await asyncio.wait_for(dirty.wait(), _STATE_PUSH_INTERVAL)
+                    await asyncio.sleep(_STATE_PUSH_COALESCE)
+                except TimeoutError:
+                    pass
+                dirty.clear()
+
+                # With no UI attached nothing is pushed, and reconnect
+                # detection only needs to keep its connected set current.
+                if self._notifier.client_count == 0:
+                    now = loop.time()
+                    if now >= next_idle_check:
+                        next_idle_check = now + _IDLE_RECONNECT_CHECK_INTERVAL
+                        await self._check_reconnections()
+                    continue
 
                 # --- Reconnect detection ---
+                started = loop.time()
                 await self._check_reconnections()
-
-                if self._notifier.client_count == 0:
-                    continue
+                checked = loop.time()
 
                 state = self._build_full_state()
+                generation = self._notifier.generation
+                now = loop.time()
+                if (
+                    state is pushed_state
+                    and generation == pushed_generation
+                    and now < next_heartbeat
+                ):
+                    continue
                 await self._notifier.broadcast("state_update", state)
+                pushed_state = state
+                pushed_generation = generation
+                next_heartbeat = now + _STATE_HEARTBEAT_INTERVAL
+
+                elapsed = loop.time() - started
+                if elapsed > _STATE_PUSH_SLOW:
+                    logger.warning(
+                        "Slow state push: %.0f ms (reconnect check %.0f ms,"
+                        " build %.0f ms, broadcast %.0f ms)",
+                        elapsed * 1000,
+                        (checked - started) * 1000,
+                        (now - checked) * 1000,
+                        (started + elapsed - now) * 1000,
+                    )
 
             except asyncio.CancelledError:
                 break
@@ -486,16 +734,12 @@ class ReplicationEngine:
         When a follower reconnects and has queued actions, notify the UI so
         the user can choose which actions to replay.
         """
-        for fid, client in self._das.follower_clients.items():
-            now_connected = client.is_running
-            was_connected = self._prev_follower_connected.get(fid, False)
-            self._prev_follower_connected[fid] = now_connected
-
-            if (
-                now_connected
-                and not was_connected
-                and self._action_queue.has_pending(fid)
-            ):
+        connected = set(self._das.running_follower_clients())
+        newly_connected = connected - self._connected_followers
+        self._connected_followers = connected
+
+        for fid in newly_connected:
+            if self._action_queue.has_pending(fid):
                 pending = self._action_queue.pending_summary(fid)
                 logger.info(
                     "Follower %s reconnected with %d queued actions",
@@ -516,7 +760,11 @@ class ReplicationEngine:
                 )
 
     def _build_full_state(self) -> dict[str, Any]:
-        """Build the full system state for the UI."""
+        """Build the full system state for the UI.
+
+        Returns the previously built dict itself when nothing changed, so
+        callers can detect an unchanged state by identity.
+        """
         master = self._das.master_client
 
         # Positions
@@ -525,27 +773,49 @@ class ReplicationEngine:
         # Connection status
         status = self._das.get_status()
 
-        # Orders
+        # Orders — a row is reused while its order's fields are unchanged.
+        # Token, symbol and side are fixed per order ID, so only quantity
+        # (replaces) and status need to be part of the key.
+        prev_rows = self._master_order_rows
+        order_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
         master_orders: list[dict[str, Any]] = []
         if master and master.is_running:
             for os in master.active_orders:
-                master_orders.append(
-                    {
+                order = os.order
+                key = (os.order_id, order.quantity, os.status)
+                row = prev_rows.get(key)
+                if row is None:
+                    row = {
                         "order_id": os.order_id,
                         "token": os.token,
                         "symbol": os.symbol,
-                        "side": str(os.order.side),
-                        "quantity": os.order.quantity,
-                        "status": str(os.status),
+                        "side": _enum_text(order.side),
+                        "quantity": order.quantity,
+                        "status": _enum_text(os.status),
                     }
-                )
+                order_rows[key] = row
+                master_orders.append(row)
+        self._master_order_rows = order_rows
 
-        return {
+        state = {
             "status": status,
             "positions": positions,
             "master_orders": master_orders,
             "short_sale_tasks": self._short_sale_mgr.get_active_tasks(),
         }
+        prev_state = self._full_state
+        if prev_state is not None:
+            # Reused rows and the cached position snapshot make this
+            # comparison mostly identity checks.
+            if state == prev_state:
+                return prev_state
+            # Carry unchanged sections over so that next tick they compare
+            # by identity as well.
+            for name, section in state.items():
+                if section == prev_state[name]:
+                    state[name] = prev_state[name]
+        self._full_state = state
+        return state
 
     # --- Queued-action replay ---
 
@@ -561,28 +831,21 @@ class ReplicationEngine:
             return {"error": f"Follower {follower_id} is not connected"}
 
         removed = self._action_queue.remove(follower_id, set(action_ids))
-        results: dict[str, dict[str, Any]] = {}
 
+        # Actions for the same master order must replay in queue order (a
+        # cancel must not overtake its submit); separate orders are replayed
+        # concurrently.
+        chains: dict[int, list[QueuedAction]] = {}
         for action in removed:
-            try:
-                result = await self._replay_single(action)
-                results[action.id] = {"success": True, **result}
-                logger.info(
-                    "Replayed %s for %s on %s",
-                    action.action_type.value,
-                    action.symbol,
-                    follower_id,
-                )
-            except Exception as e:
-                results[action.id] = {"success": False, "error": str(e)}
-                logger.error(
-                    "Failed to replay %s for %s on %s: %s",
-                    action.action_type.value,
-                    action.symbol,
-                    follower_id,
-                    e,
-                )
+            chains.setdefault(action.payload.master_order_id, []).append(action)
+        sem = asyncio.Semaphore(_REPLAY_CONCURRENCY)
+        outcomes: dict[str, dict[str, Any]] = {}
+        await asyncio.gather(
+            *(self._replay_chain(chain, sem, outcomes) for chain in chains.values())
+        )
+        results = {action.id: outcomes[action.id] for action in removed}
 
+        self._mark_dirty()
         await self._notifier.broadcast(
             "actions_replayed",
             {
@@ -597,27 +860,63 @@ class ReplicationEngine:
     ) -> int:
         """Discard (remove without replaying) selected queued actions."""
         removed = self._action_queue.remove(follower_id, set(action_ids))
+        if removed:
+            self._mark_dirty()
         return len(removed)
 
-    async def _replay_single(
+    async def _replay_chain(
+        self,
+        actions: list[QueuedAction],
+        sem: asyncio.Semaphore,
+        results: dict[str, dict[str, Any]],
+    ) -> None:
+        """Replay *actions* in order, storing each result by action id."""
+        async with sem:
+            for action in actions:
+                results[action.id] = await self._replay_single(action)
+
+    async def _replay_single(self, action: QueuedAction) -> dict[str, Any]:
+        """Replay a single queued action and return its result.
+
+        Never raises: a failure is reported as ``{"success": False, "error": ...}``.
+        """
+        try:
+            result = await self._execute_action(action)
+        except Exception as e:
+            logger.error(
+                "Failed to replay %s for %s on %s: %s",
+                action.action_type.value,
+                action.symbol,
+                action.follower_id,
+                e,
+            )
+            return {"success": False, "error": str(e)}
+
+        logger.info(
+            "Replayed %s for %s on %s",
+            action.action_type.value,
+            action.symbol,
+            action.follower_id,
+        )
+        return {"success": True, **result}
+
+    async def _execute_action(
         self,
         action: QueuedAction,
     ) -> dict[str, Any]:
         """Execute a single queued action. Returns a result dict."""
         master = self._das.master_client
 
-        if action.action_type == QueuedActionType.ORDER_SUBMIT:
-            master_order_id = action.payload.get("master_order_id")
-            master_order = (
-                master.get_order(master_order_id)
-                if master and master_order_id
-                else None
-            )
-            if master_order and master_order_id is not None:
+        match action.payload:
+            case SubmitPayload(master_order_id):
+                master_order = master.get_order(master_order_id) if master else None
+                if not master_order:
+                    return {"skipped": True, "reason": "Master order no longer exists"}
+
                 # Short sales go through ShortSaleManager for
                 # capacity check + on-demand locate.
                 if master_order.is_short:
-                    config = self._follower_configs.get(action.follower_id, {})
+                    config = self._follower_configs.get(action.follower_id, _NO_CONFIG)
                     task_id = await self._short_sale_mgr.handle_short_sale(
                         master_order,
                         action.follower_id,
@@ -632,12 +931,8 @@ class ReplicationEngine:
                     master_order_id=master_order_id,
                 )
                 return {"follower_order_id": follower_oid}
-            else:
-                return {"skipped": True, "reason": "Master order no longer exists"}
 
-        elif action.action_type == QueuedActionType.ORDER_CANCEL:
-            master_order_id = action.payload.get("master_order_id")
-            if master_order_id is not None:
+            case CancelPayload(master_order_id):
                 res = await self._order_replicator.cancel_follower_orders(
                     master_order_id
                 )
@@ -650,30 +945,13 @@ class ReplicationEngine:
                         master_order_id,
                     )
                 return {"cancel_result": cancel_ok}
-            return {"skipped": True, "reason": "No master order ID"}
-
-        elif action.action_type == QueuedActionType.ORDER_REPLACE:
-            master_order_id = action.payload.get("master_order_id")
-            new_qty = action.payload.get("new_quantity")
-            new_price_str = action.payload.get("new_price", "")
-            new_price: Decimal | None = None
-            if new_price_str:
-                try:
-                    new_price = Decimal(new_price_str)
-                except Exception:
-                    logger.warning(
-                        "Invalid price '%s' in queued replace "
-                        "action %s, skipping price change",
-                        new_price_str,
-                        action.id,
-                    )
-            if master_order_id is not None:
+
+            case ReplacePayload(master_order_id, new_qty, new_price):
                 res = await self._order_replicator.replace_follower_orders(
                     master_order_id,
                     new_quantity=new_qty,
                     new_price=new_price,
                 )
                 return {"replace_result": res.get(action.follower_id, False)}
-            return {"skipped": True, "reason": "No master order ID"}
 
         return {"skipped": True, "reason": f"Unknown action type: {action.action_type}"}
@@ -21,9 +21,8 @@ RESTART_HOUR = 3
 RESTART_MINUTE = 0
 
 
-def _seconds_until_next_restart() -> float:
-    """Calculate seconds until the next 3:00 AM New York time."""
-    now = datetime.now(NY_TZ)
+def _next_restart(now: datetime) -> datetime:
+    """Return the next 3:00 AM New York time after *now*."""
     target = now.replace(
         hour=RESTART_HOUR,
         minute=RESTART_MINUTE,
@@ -32,7 +31,23 @@ def _seconds_until_next_restart() -> float:
     )
     if target <= now:
         target += timedelta(days=1)
-    return (target - now).total_seconds()
+    return target
+
+
+async def _restart(das_service: DASService, engine: ReplicationEngine) -> None:
+    """Stop the engine and DAS service, then start them again.
+
+    The order matters: the engine unsubscribes from the master client before
+    the DAS service tears it down, and needs a started service to subscribe.
+    """
+    # Capture follower configs before stopping
+    follower_configs = engine.follower_configs
+
+    await engine.stop()
+    await das_service.stop()
+
+    await das_service.start()
+    await engine.start(follower_configs=follower_configs)
 
 
 async def daily_restart_loop(
@@ -45,8 +60,9 @@ async def daily_restart_loop(
     during application lifespan. Cancel it on shutdown.
     """
     while True:
-        wait_secs = _seconds_until_next_restart()
-        next_restart = datetime.now(NY_TZ) + timedelta(seconds=wait_secs)
+        now = datetime.now(NY_TZ)
+        next_restart = _next_restart(now)
+        wait_secs = (next_restart - now).total_seconds()
         logger.info(
             "Daily restart scheduled for %s (in %.0f seconds)",
             next_restart.strftime("%Y-%m-%d %H:%M %Z"),
@@ -60,19 +76,15 @@ async def daily_restart_loop(
             return
 
         logger.info("Starting daily restart...")
+        restart = asyncio.create_task(_restart(das_service, engine))
         try:
-            # Capture follower configs before stopping
-            follower_configs = engine.follower_configs
-
-            await engine.stop()
-            await das_service.stop()
-
-            await das_service.start()
-            await engine.start(follower_configs=follower_configs)
-
+            await asyncio.shield(restart)
             logger.info("Daily restart completed successfully")
         except asyncio.CancelledError:
-            logger.info("Daily restart interrupted by shutdown")
+            # Finish the restart first so shutdown never stops a half-started
+            # engine or races it on the DAS clients.
+            logger.info("Shutdown requested during daily restart; finishing it")
+            await asyncio.gather(restart, return_exceptions=True)
             return
         except Exception as e:
             logger.error("Daily restart failed: %s", e, exc_info=True)
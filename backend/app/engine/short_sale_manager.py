@@ -7,18 +7,26 @@ auto-locate exactly the deficit via ``smart_locate()`` before placing the
 order.
 
 Concurrency controls:
-  - Per-(follower, symbol) ``asyncio.Lock`` prevents double-locating when
-    multiple shorts on the same symbol arrive in quick succession.
-  - A global ``asyncio.Semaphore`` caps the number of concurrent
-    ``smart_locate()`` calls to respect DAS API limits.
+  - Only one task per (follower, symbol) runs at a time, which prevents
+    double-locating when multiple shorts on the same symbol arrive in quick
+    succession. Keys are tracked in an in-flight set under an
+    ``asyncio.Condition``, so memory stays proportional to active tasks.
+  - A global admission limit caps the number of concurrent
+    ``smart_locate()`` calls to respect DAS API limits. The engine re-reads
+    it from ``MAX_CONCURRENT_LOCATES`` on every start via
+    ``set_max_concurrent_locates()``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
 import time
-from dataclasses import asdict, dataclass, field
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any
 
@@ -35,8 +43,27 @@ logger = logging.getLogger(__name__)
 # Default maximum concurrent smart_locate calls across all followers.
 _DEFAULT_MAX_CONCURRENT_LOCATES = 3
 
+# Finished (completed/failed/cancelled) tasks kept for the task history API.
+_RECENT_TASKS_KEPT = 500
 
-@dataclass
+# How long a cancelled master order id is remembered. Active tasks of the
+# order are cancelled directly; the id only guards tasks created around the
+# same moment, so a short window is enough.
+_CANCELLED_ORDER_TTL = 600.0  # seconds
+
+_ACTIVE_STATUSES = frozenset({"pending", "checking", "locating", "placing_order"})
+
+
+@functools.lru_cache(maxsize=128)
+def _config_decimal(value: float | str) -> Decimal:
+    """Convert a follower-config number to ``Decimal`` via its string form.
+
+    Cached because each follower's config values repeat on every task.
+    """
+    return Decimal(str(value))
+
+
+@dataclass(slots=True)
 class ShortSaleTask:
     """Tracks a single locate-then-short workflow for one follower."""
 
@@ -53,8 +80,18 @@ class ShortSaleTask:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to a plain dictionary for serialisation."""
-        d = asdict(self)
-        return d
+        return {
+            "id": self.id,
+            "follower_id": self.follower_id,
+            "symbol": self.symbol,
+            "master_order_id": self.master_order_id,
+            "required_qty": self.required_qty,
+            "status": self.status,
+            "locate_deficit": self.locate_deficit,
+            "error": self.error,
+            "created_at": self.created_at,
+            "follower_order_id": self.follower_order_id,
+        }
 
 
 class ShortSaleManager:
@@ -77,17 +114,24 @@ class ShortSaleManager:
         self._order_replicator = order_replicator
         self._notifier = notifier
 
-        # Task tracking
-        self._tasks: dict[str, ShortSaleTask] = {}
+        # Task tracking: running tasks by id, plus a bounded history of
+        # finished ones (oldest first)
+        self._active_tasks: dict[str, ShortSaleTask] = {}
+        self._recent_tasks: deque[ShortSaleTask] = deque(maxlen=_RECENT_TASKS_KEPT)
+        # master_order_id → ids of its active tasks
+        self._tasks_by_master: dict[int, set[str]] = {}
         self._task_futures: dict[str, asyncio.Task[None]] = {}
         self._counter = 0
 
         # Concurrency control
-        self._global_semaphore = asyncio.Semaphore(max_concurrent_locates)
-        self._symbol_locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._locate_cv = asyncio.Condition()
+        self._active_locates = 0
+        self._max_locates = max_concurrent_locates
+        self._symbol_cv = asyncio.Condition()
+        self._inflight_symbols: set[tuple[str, str]] = set()
 
-        # Master orders cancelled while a locate was in-flight
-        self._cancelled_master_orders: set[int] = set()
+        # Master orders cancelled recently → time.monotonic() of the cancel
+        self._cancelled_master_orders: OrderedDict[int, float] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Public API
@@ -98,7 +142,7 @@ class ShortSaleManager:
         master_order: BaseOrder,
         follower_id: str,
         master_order_id: int,
-        follower_config: dict[str, Any],
+        follower_config: Mapping[str, Any],
     ) -> str:
         """Entry point called by ReplicationEngine for short sale orders.
 
@@ -107,7 +151,8 @@ class ShortSaleManager:
         """
         symbol = master_order.symbol
         multiplier = self._multiplier_mgr.get_effective(follower_id, symbol)
-        required_qty = max(round(master_order.quantity * multiplier), 0)
+        scaled = round(master_order.quantity * multiplier)
+        required_qty = scaled if scaled > 0 else 0
 
         if required_qty == 0:
             logger.info(
@@ -124,9 +169,8 @@ class ShortSaleManager:
             master_order_id=master_order_id,
             required_qty=required_qty,
         )
-        self._tasks[task.id] = task
-
-        await self._broadcast_task(task)
+        self._active_tasks[task.id] = task
+        self._tasks_by_master.setdefault(master_order_id, set()).add(task.id)
 
         future = asyncio.create_task(
             self._execute_task(task, master_order, follower_config),
@@ -150,14 +194,11 @@ class ShortSaleManager:
         If any in-flight short-sale tasks reference this order,
         cancel them so we don't locate/place an unwanted order.
         """
-        self._cancelled_master_orders.add(master_order_id)
-
-        for task_id, task in list(self._tasks.items()):
-            if task.master_order_id == master_order_id and task.status in (
-                "pending",
-                "checking",
-                "locating",
-            ):
+        self._remember_cancelled(master_order_id)
+
+        for task_id in list(self._tasks_by_master.get(master_order_id, ())):
+            task = self._active_tasks.get(task_id)
+            if task and task.status in ("pending", "checking", "locating"):
                 logger.info(
                     "Cancelling short sale task %s — master order %s cancelled",
                     task_id,
@@ -172,25 +213,45 @@ class ShortSaleManager:
             future.cancel()
             return True
 
-        task = self._tasks.get(task_id)
+        task = self._active_tasks.get(task_id)
         if task and task.status in ("pending", "checking", "locating"):
             task.status = "cancelled"
-            await self._broadcast_task(task)
+            self._broadcast_task(task)
             return True
 
         return False
 
     def get_active_tasks(self) -> list[dict[str, Any]]:
         """Return all non-terminal tasks for the UI."""
+        # A task turns terminal just before it is retired, so filter the
+        # (small) active set rather than trusting membership alone.
         return [
             t.to_dict()
-            for t in self._tasks.values()
-            if t.status not in ("completed", "failed", "cancelled")
+            for t in self._active_tasks.values()
+            if t.status in _ACTIVE_STATUSES
         ]
 
     def get_all_tasks(self) -> list[dict[str, Any]]:
-        """Return all tasks (including terminal) for debugging/API."""
-        return [t.to_dict() for t in self._tasks.values()]
+        """Return active tasks and recently finished ones for debugging/API."""
+        return [
+            t.to_dict()
+            for tasks in (self._recent_tasks, self._active_tasks.values())
+            for t in tasks
+        ]
+
+    async def set_max_concurrent_locates(self, limit: int) -> None:
+        """Change the cap on concurrent ``smart_locate()`` calls.
+
+        Raising the cap admits waiting tasks immediately; lowering it lets
+        in-flight locates finish and admits no more until below the new cap.
+        """
+        if limit < 1:
+            raise ValueError("max_concurrent_locates must be at least 1")
+        async with self._locate_cv:
+            raised = limit > self._max_locates
+            self._max_locates = limit
+            if raised:
+                self._locate_cv.notify_all()
 
     async def cancel_all(self) -> None:
         """Cancel every in-flight task (used during shutdown)."""
@@ -198,7 +259,8 @@ class ShortSaleManager:
         for f in futures:
             f.cancel()
         if futures:
-            await asyncio.gather(*futures, return_exceptions=True)
+            # Failures are already logged by _task_done_callback
+            await asyncio.wait(futures)
         self._task_futures.clear()
 
     # ------------------------------------------------------------------
@@ -209,14 +271,65 @@ class ShortSaleManager:
         self._counter += 1
         return f"sst-{self._counter}-{int(time.time() * 1000)}"
 
-    def _get_symbol_lock(self, follower_id: str, symbol: str) -> asyncio.Lock:
+    def _remember_cancelled(self, master_order_id: int) -> None:
+        """Record a master cancel and forget those older than the TTL."""
+        now = time.monotonic()
+        cancelled = self._cancelled_master_orders
+        cancelled[master_order_id] = now
+        cancelled.move_to_end(master_order_id)
+        cutoff = now - _CANCELLED_ORDER_TTL
+        while next(iter(cancelled.values())) < cutoff:
+            cancelled.popitem(last=False)
+
+    @contextlib.asynccontextmanager
+    async def _symbol_slot(self, follower_id: str, symbol: str) -> AsyncIterator[None]:
+        """Hold the (follower, symbol) slot for the duration of the block."""
         key = (follower_id, symbol)
-        if key not in self._symbol_locks:
-            self._symbol_locks[key] = asyncio.Lock()
-        return self._symbol_locks[key]
+        cv = self._symbol_cv
+        async with cv:
+            await cv.wait_for(lambda: key not in self._inflight_symbols)
+            self._inflight_symbols.add(key)
+        try:
+            yield
+        finally:
+            # Free the key before notifying so it cannot leak even if the
+            # notify step is interrupted.
+            self._inflight_symbols.discard(key)
+            async with cv:
+                cv.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def _locate_slot(self) -> AsyncIterator[None]:
+        """Hold one of the global ``smart_locate()`` slots."""
+        cv = self._locate_cv
+        async with cv:
+            await cv.wait_for(lambda: self._active_locates < self._max_locates)
+            self._active_locates += 1
+        try:
+            yield
+        finally:
+            self._active_locates -= 1
+            async with cv:
+                # notify_all: a single wake-up could be lost to a waiter that
+                # is cancelled at the same moment.
+                cv.notify_all()
 
-    async def _broadcast_task(self, task: ShortSaleTask) -> None:
-        await self._notifier.broadcast("short_sale_task_update", task.to_dict())
+    def _abort_if_cancelled(self, task: ShortSaleTask, stage: str) -> bool:
+        """Mark *task* cancelled if its master order was cancelled.
+
+        Returns True when the task was aborted; *stage* goes into the error.
+        """
+        if task.master_order_id not in self._cancelled_master_orders:
+            return False
+        task.status = "cancelled"
+        task.error = f"Master order cancelled {stage}"
+        self._broadcast_task(task)
+        return True
+
+    def _broadcast_task(self, task: ShortSaleTask) -> None:
+        # Queued, not awaited: a slow WebSocket client must not hold up the
+        # locate-then-short workflow.
+        self._notifier.enqueue("short_sale_task_update", task.to_dict())
 
     def _task_done_callback(self, future: asyncio.Task[None]) -> None:
         if future.cancelled():
@@ -233,24 +346,29 @@ class ShortSaleManager:
         self,
         task: ShortSaleTask,
         master_order: BaseOrder,
-        follower_config: dict[str, Any],
+        follower_config: Mapping[str, Any],
     ) -> None:
-        """Core workflow: check capacity → locate deficit → place order."""
-        lock = self._get_symbol_lock(task.follower_id, task.symbol)
+        """Core workflow: check capacity → locate deficit → place order.
 
+        Status updates are broadcast only ahead of real waits (symbol slot,
+        DAS calls) and at the end, not for every transition.
+        """
         try:
-            async with lock:
+            if (task.follower_id, task.symbol) in self._inflight_symbols:
+                # Show the task as pending while an earlier one holds the slot
+                self._broadcast_task(task)
+            async with self._symbol_slot(task.follower_id, task.symbol):
                 await self._execute_task_locked(task, master_order, follower_config)
         except asyncio.CancelledError:
             task.status = "cancelled"
             logger.info("Short sale task %s cancelled", task.id)
-            await self._broadcast_task(task)
+            self._broadcast_task(task)
         except Exception as e:
             task.status = "failed"
             task.error = str(e)
             logger.error("Short sale task %s failed: %s", task.id, e)
-            await self._broadcast_task(task)
-            await self._notifier.broadcast(
+            self._broadcast_task(task)
+            self._notifier.enqueue(
                 "alert",
                 {
                     "level": "error",
@@ -262,32 +380,36 @@ class ShortSaleManager:
             )
         finally:
             self._task_futures.pop(task.id, None)
+            self._active_tasks.pop(task.id, None)
+            self._recent_tasks.append(task)
+            siblings = self._tasks_by_master.get(task.master_order_id)
+            if siblings is not None:
+                siblings.discard(task.id)
+                if not siblings:
+                    del self._tasks_by_master[task.master_order_id]
 
     async def _execute_task_locked(
         self,
         task: ShortSaleTask,
         master_order: BaseOrder,
-        follower_config: dict[str, Any],
+        follower_config: Mapping[str, Any],
     ) -> None:
-        """Runs inside the per-(follower, symbol) lock."""
+        """Runs while holding the (follower, symbol) slot."""
         # --- Check cancellation ---
-        if task.master_order_id in self._cancelled_master_orders:
-            task.status = "cancelled"
-            task.error = "Master order cancelled before execution"
-            await self._broadcast_task(task)
+        if self._abort_if_cancelled(task, "before execution"):
             return
 
-        # --- Check capacity ---
-        task.status = "checking"
-        await self._broadcast_task(task)
-
         client = self._das.get_connected_follower(task.follower_id)
         if not client:
             task.status = "failed"
             task.error = "Follower not connected"
-            await self._broadcast_task(task)
+            self._broadcast_task(task)
             return
 
+        # --- Check capacity ---
+        task.status = "checking"
+        self._broadcast_task(task)
+
         max_sell = await client.get_max_sell(task.symbol, strategy="precise")
         logger.info(
             "Follower %s max_sell for %s is %d", task.follower_id, task.symbol, max_sell
@@ -306,11 +428,19 @@ class ShortSaleManager:
 
         # --- Locate if needed ---
         if deficit > 0:
+            # The symbol may have been blacklisted while this task waited;
+            # don't take a locate slot (or pay for a locate) in that case.
+            if self._blacklist_mgr.is_blacklisted(task.follower_id, task.symbol):
+                task.status = "cancelled"
+                task.error = "Symbol blacklisted before locate"
+                self._broadcast_task(task)
+                return
+
             task.locate_deficit = deficit
             task.status = "locating"
-            await self._broadcast_task(task)
+            self._broadcast_task(task)
 
-            max_price = Decimal(str(follower_config.get("max_locate_price", 0.10)))
+            max_price = _config_decimal(follower_config.get("max_locate_price", 0.10))
             timeout = float(follower_config.get("locate_retry_timeout", 120))
 
             logger.info(
@@ -323,12 +453,9 @@ class ShortSaleManager:
                 timeout,
             )
 
-            async with self._global_semaphore:
-                # Re-check cancellation after potentially waiting on semaphore
-                if task.master_order_id in self._cancelled_master_orders:
-                    task.status = "cancelled"
-                    task.error = "Master order cancelled while waiting"
-                    await self._broadcast_task(task)
+            async with self._locate_slot():
+                # Re-check cancellation after potentially waiting for a slot
+                if self._abort_if_cancelled(task, "while waiting"):
                     return
 
                 result = await client.smart_locate(
@@ -347,8 +474,8 @@ class ShortSaleManager:
                     task.id,
                     task.error,
                 )
-                await self._broadcast_task(task)
-                await self._notifier.broadcast(
+                self._broadcast_task(task)
+                self._notifier.enqueue(
                     "alert",
                     {
                         "level": "warn",
@@ -369,15 +496,12 @@ class ShortSaleManager:
             )
 
         # --- Re-check cancellation before placing order ---
-        if task.master_order_id in self._cancelled_master_orders:
-            task.status = "cancelled"
-            task.error = "Master order cancelled after locate"
-            await self._broadcast_task(task)
+        if self._abort_if_cancelled(task, "after locate"):
             return
 
         # --- Place the order ---
         task.status = "placing_order"
-        await self._broadcast_task(task)
+        self._broadcast_task(task)
 
         follower_oid = await self._order_replicator.replicate_order(
             master_order,
@@ -401,4 +525,4 @@ class ShortSaleManager:
                 task.id,
             )
 
-        await self._broadcast_task(task)
+        self._broadcast_task(task)
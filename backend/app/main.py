@@ -45,14 +45,21 @@ _notifier = NotificationService()
 _engine = ReplicationEngine(_das_service, _notifier)
 
 
+# Delay after the first new log entry so a burst goes out as one message
+_LOG_BROADCAST_COALESCE = 0.25  # seconds
+
+
 async def _log_broadcast_loop() -> None:
-    """Periodically drain new log entries and broadcast them via WebSocket."""
+    """Broadcast new log entries via WebSocket shortly after they are logged."""
+    appended = log_buffer.watch()
     last_seq = log_buffer.latest_seq
     while True:
-        await asyncio.sleep(2)
+        await appended.wait()
+        await asyncio.sleep(_LOG_BROADCAST_COALESCE)
+        appended.clear()
         new = log_buffer.get_new_entries(since_seq=last_seq)
         if new and _notifier.client_count > 0:
-            last_seq = new[-1]["seq"]
+            last_seq = new[-1].seq
             await _notifier.broadcast("log_entries", {"entries": new})
 
 
@@ -116,7 +123,10 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down...")
     restart_task.cancel()
     log_task.cancel()
+    # A daily restart in progress completes before the final stop
+    await asyncio.gather(restart_task, return_exceptions=True)
     await _engine.stop()
+    await _notifier.aclose()
     await _das_service.stop()
     await close_db()
     logger.info("Shutdown complete")
@@ -177,4 +187,7 @@ if __name__ == "__main__":
         port=config.app_port,
         reload=False,
         log_level=config.log_level.lower(),
+        # uvloop when available (uvicorn[standard] on Linux/macOS); falls back
+        # to the stock asyncio loop on Windows.
+        loop="auto",
     )
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 
 from pydantic import BaseModel, field_validator
 
-_TICKER_RE = re.compile(r"^[A-Za-z]{1,5}$")
+
+def _is_ticker(symbol: str) -> bool:
+    """Return True for 1-5 ASCII letters."""
+    return len(symbol) <= 5 and symbol.isascii() and symbol.isalpha()
 
 
 class BlacklistEntryCreate(BaseModel):
@@ -22,7 +24,7 @@ class BlacklistEntryCreate(BaseModel):
     def validate_symbol(cls, v: str) -> str:
         """Normalize and validate the ticker symbol."""
         v = v.strip().upper()
-        if not _TICKER_RE.match(v):
+        if not _is_ticker(v):
             raise ValueError("Symbol must be 1-5 letters only")
         return v
 
@@ -21,4 +21,4 @@ class OrderReplicationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel
 
+ReconcileScenario = Literal["common_same_dir", "common_diff_dir", "master_only"]
+ReconcileAction = Literal["use_inferred", "manual", "use_default"]
+
 
 class ReconcilePositionEntry(BaseModel):
     """A single symbol entry in the reconciliation comparison."""
@@ -13,12 +18,12 @@ class ReconcilePositionEntry(BaseModel):
     master_side: str
     follower_qty: int
     follower_side: str | None
-    scenario: str  # "common_same_dir" | "common_diff_dir" | "master_only"
+    scenario: ReconcileScenario
     inferred_multiplier: float | None
     current_multiplier: float
     current_source: str  # "base" | "user_override"
     is_blacklisted: bool
-    default_action: str  # "use_inferred" | "blacklist"
+    default_action: Literal["use_inferred", "blacklist"]
 
 
 class ReconcileFollowerData(BaseModel):
@@ -41,7 +46,7 @@ class ReconcileDecision(BaseModel):
     """A user's decision for a single symbol."""
 
     symbol: str
-    action: str  # "use_inferred" | "manual" | "use_default"
+    action: ReconcileAction
     multiplier: float | None = None
     blacklist: bool
 
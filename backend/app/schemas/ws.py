@@ -12,3 +12,5 @@ class WSMessage(BaseModel):
 
     type: str
     data: dict[str, Any] = {}
+
+    model_config = {"defer_build": True}
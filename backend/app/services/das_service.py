@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import KeysView, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from das_bridge import DASClient
@@ -25,9 +27,17 @@ class DASService:
     def __init__(self) -> None:
         """Initialize the DAS service with empty client registries."""
         self._master_client: DASClient | None = None
+        # Copy-on-write: replaced, never mutated, so the read-only view handed
+        # out by follower_clients stays a consistent snapshot across awaits
         self._follower_clients: dict[str, DASClient] = {}
+        self._follower_clients_view: Mapping[str, DASClient] = MappingProxyType(
+            self._follower_clients
+        )
         self._master_config: dict[str, Any] | None = None
         self._follower_configs: dict[str, dict[str, Any]] = {}
+        # GlobalConfig built once per configure_*() call, reused by every start()
+        self._master_global_config: GlobalConfig | None = None
+        self._follower_global_configs: dict[str, GlobalConfig] = {}
         self._running = False
 
     @property
@@ -36,9 +46,22 @@ class DASService:
         return self._master_client
 
     @property
-    def follower_clients(self) -> dict[str, DASClient]:
-        """Return a shallow copy of the follower client registry."""
-        return dict(self._follower_clients)
+    def follower_clients(self) -> Mapping[str, DASClient]:
+        """Return a read-only snapshot of the follower client registry."""
+        return self._follower_clients_view
+
+    @property
+    def follower_ids(self) -> KeysView[str]:
+        """Return a view of the currently registered follower IDs."""
+        return self._follower_clients.keys()
+
+    def running_follower_clients(self) -> dict[str, DASClient]:
+        """Return the follower clients that are currently connected."""
+        return {
+            fid: client
+            for fid, client in self._follower_clients.items()
+            if client.is_running
+        }
 
     def get_follower_client(self, follower_id: str) -> DASClient | None:
         """Get a single follower client by ID."""
@@ -80,6 +103,7 @@ class DASService:
     async def configure_master(self, config: dict[str, Any]) -> None:
         """Set master account configuration. Must be called before start()."""
         self._master_config = config
+        self._master_global_config = self._build_config(config)
         logger.info(
             "Master account configured: %s@%s:%s",
             config["username"],
@@ -92,6 +116,7 @@ class DASService:
     ) -> None:
         """Add or update a follower account configuration."""
         self._follower_configs[follower_id] = config
+        self._follower_global_configs[follower_id] = self._build_config(config)
         logger.info(
             "Follower %s configured: %s@%s:%s",
             follower_id,
@@ -102,13 +127,21 @@ class DASService:
 
     async def remove_follower(self, follower_id: str) -> None:
         """Remove a follower. Stops its client if running."""
-        if follower_id in self._follower_clients:
-            client = self._follower_clients.pop(follower_id)
+        client = self._follower_clients.get(follower_id)
+        if client is not None:
+            self._set_follower_clients(
+                {
+                    fid: c
+                    for fid, c in self._follower_clients.items()
+                    if fid != follower_id
+                }
+            )
             try:
                 await client.stop()
             except Exception as e:
                 logger.warning("Error stopping follower %s: %s", follower_id, e)
         self._follower_configs.pop(follower_id, None)
+        self._follower_global_configs.pop(follower_id, None)
 
     async def start(self) -> None:
         """Start master and all follower clients."""
@@ -116,34 +149,39 @@ class DASService:
             logger.warning("DASService already running")
             return
 
-        if not self._master_config:
+        if self._master_global_config is None:
             raise RuntimeError("Master account not configured")
 
         # Start master
-        master_cfg = self._build_config(self._master_config)
-        self._master_client = DASClient(master_cfg)
+        self._master_client = DASClient(self._master_global_config)
         await self._master_client.start()
         logger.info("Master client started")
 
-        # Start followers concurrently
-        start_tasks: list[asyncio.Task[None]] = []
-        for fid, fcfg in self._follower_configs.items():
-            client = DASClient(self._build_config(fcfg))
-            self._follower_clients[fid] = client
-            start_tasks.append(asyncio.ensure_future(self._start_follower(fid, client)))
-
-        if start_tasks:
-            results = await asyncio.gather(*start_tasks, return_exceptions=True)
-            for fid, result in zip(self._follower_configs.keys(), results):
-                if isinstance(result, Exception):
-                    logger.error("Failed to start follower %s: %s", fid, result)
+        # Start followers concurrently; failures are logged per follower so
+        # one bad account doesn't cancel the others
+        clients = {
+            fid: DASClient(fcfg) for fid, fcfg in self._follower_global_configs.items()
+        }
+        self._set_follower_clients(clients)
+        async with asyncio.TaskGroup() as tg:
+            for fid, client in clients.items():
+                tg.create_task(self._start_follower(fid, client), name=fid)
 
         self._running = True
         logger.info("DASService started with %d followers", len(self._follower_clients))
 
+    def _set_follower_clients(self, clients: dict[str, DASClient]) -> None:
+        """Publish a new follower registry snapshot."""
+        self._follower_clients = clients
+        self._follower_clients_view = MappingProxyType(clients)
+
     async def _start_follower(self, follower_id: str, client: DASClient) -> None:
-        """Start a single follower client."""
-        await client.start()
+        """Start a single follower client, logging rather than raising failures."""
+        try:
+            await client.start()
+        except Exception as e:
+            logger.error("Failed to start follower %s: %s", follower_id, e)
+            return
         logger.info("Follower %s client started", follower_id)
 
     async def stop(self) -> None:
@@ -152,12 +190,9 @@ class DASService:
             return
 
         # Stop followers concurrently
-        stop_tasks: list[asyncio.Task[None]] = []
-        for fid, client in self._follower_clients.items():
-            stop_tasks.append(asyncio.ensure_future(self._stop_client(fid, client)))
-
-        if stop_tasks:
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
+        async with asyncio.TaskGroup() as tg:
+            for fid, client in self._follower_clients.items():
+                tg.create_task(self._stop_client(fid, client), name=fid)
 
         # Stop master
         if self._master_client:
@@ -167,7 +202,7 @@ class DASService:
                 logger.warning("Error stopping master: %s", e)
             self._master_client = None
 
-        self._follower_clients.clear()
+        self._set_follower_clients({})
         self._running = False
         logger.info("DASService stopped")
 
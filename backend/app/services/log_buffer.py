@@ -7,29 +7,91 @@ Disk logs are written to a per-run directory with separate files for each source
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import itertools
 import logging
 import pathlib
+import queue
 import threading
+import time
 from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from io import TextIOWrapper
+from logging.handlers import QueueHandler, QueueListener
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """A single buffered log record, serialized as-is to API and WS clients."""
+
+    timestamp: float
+    level: str
+    source: str
+    logger: str
+    message: str
+    seq: int = 0
 
 
 class LogBuffer:
-    """Thread-safe ring buffer that stores recent log entries."""
+    """Thread-safe ring buffer that stores recent log entries.
+
+    Entries are appended without a lock: they arrive through
+    :class:`LogBufferHandler`, which ``logging`` already runs under the
+    handler's own lock, so they land in ``seq`` order. Readers walk the deque
+    back from the newest entry and, if another thread appends mid-walk, retry
+    over a ``list()`` copy, which is a single C-level copy under the GIL.
+    """
 
     def __init__(self, max_entries: int = 2000) -> None:
         """Initialize the buffer with a fixed maximum size."""
-        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
-        self._lock = threading.Lock()
-        self._seq = 0
-
-    def append(self, entry: dict[str, Any]) -> None:
+        self._max_entries = max_entries
+        self._entries: deque[LogEntry] = deque(maxlen=max_entries)
+        # Same entries again, per source, so filtered reads skip the others
+        self._by_source: dict[str, deque[LogEntry]] = {
+            "app": deque(maxlen=max_entries),
+            "das_bridge": deque(maxlen=max_entries),
+        }
+        self._seq = itertools.count(1)
+        self._latest_seq = 0
+        # Set on append once watch() has been called from the event loop
+        self._appended: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+
+    def watch(self) -> asyncio.Event:
+        """Return an event that is set whenever an entry is appended.
+
+        Must be called from the event loop that will wait on the event. The
+        waiter clears it after handling the new entries.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._appended = asyncio.Event()
+        return self._appended
+
+    def append(self, entry: LogEntry) -> None:
         """Add a log entry to the buffer with a sequence number."""
-        with self._lock:
-            self._seq += 1
-            entry["seq"] = self._seq
-            self._entries.append(entry)
+        entry.seq = seq = next(self._seq)
+        self._entries.append(entry)
+        by_source = self._by_source.get(entry.source)
+        if by_source is None:
+            by_source = self._by_source[entry.source] = deque(maxlen=self._max_entries)
+        by_source.append(entry)
+        self._latest_seq = seq
+
+        appended, loop = self._appended, self._loop
+        if appended is None or loop is None or appended.is_set():
+            return
+        if threading.get_ident() == self._loop_thread:
+            appended.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(appended.set)
+            except RuntimeError:
+                pass  # event loop already closed
 
     def get_entries(
         self,
@@ -37,38 +99,82 @@ class LogBuffer:
         source: str | None = None,
         since_seq: int = 0,
         limit: int = 200,
-    ) -> list[dict[str, Any]]:
+    ) -> list[LogEntry]:
         """Return entries, optionally filtered by source and sequence."""
-        with self._lock:
-            entries = list(self._entries)
-        if source:
-            entries = [e for e in entries if e["source"] == source]
-        if since_seq:
-            entries = [e for e in entries if e["seq"] > since_seq]
-        return entries[-limit:]
-
-    def get_new_entries(self, since_seq: int = 0) -> list[dict[str, Any]]:
+        if not source:
+            return self._scan(self._entries, since_seq, limit)
+        entries = self._by_source.get(source)
+        if entries is None:
+            return []
+        return self._scan(entries, since_seq, limit)
+
+    def get_new_entries(self, since_seq: int = 0) -> list[LogEntry]:
         """Return all entries newer than *since_seq*."""
-        with self._lock:
-            return [e for e in self._entries if e["seq"] > since_seq]
+        return self._scan(self._entries, since_seq)
+
+    @staticmethod
+    def _scan(
+        entries: deque[LogEntry], since_seq: int, limit: int | None = None
+    ) -> list[LogEntry]:
+        """Tail-walk a live deque, falling back to a snapshot if it changes."""
+        try:
+            return _tail(entries, since_seq, limit)
+        except RuntimeError:
+            # Appended to from another thread mid-walk; walk a snapshot instead
+            return _tail(list(entries), since_seq, limit)
 
     def clear(self) -> None:
         """Remove all entries from the buffer."""
-        with self._lock:
-            self._entries.clear()
+        self._entries.clear()
+        for entries in self._by_source.values():
+            entries.clear()
 
     @property
     def latest_seq(self) -> int:
         """Return the most recent sequence number."""
-        with self._lock:
-            return self._seq
+        return self._latest_seq
+
+
+def _tail(
+    entries: Sequence[LogEntry],
+    since_seq: int,
+    limit: int | None = None,
+) -> list[LogEntry]:
+    """Walk *entries* back from the newest until ``seq <= since_seq``.
+
+    Sequence numbers increase along the buffer, so this costs one step per
+    returned entry rather than a scan of the whole buffer, and stops as soon
+    as *limit* entries have been collected.
+    """
+    out: list[LogEntry] = []
+    for e in reversed(entries):
+        if e.seq <= since_seq:
+            break
+        out.append(e)
+        if len(out) == limit:
+            break
+    out.reverse()
+    return out
+
+
+_DAS_BRIDGE_PREFIXES = ("das_bridge",)
+
+# logger name → source tag; logger names are few and long-lived
+_source_cache: dict[str, str] = {}
+
+
+def _source_of(name: str) -> str:
+    """Return ``"das_bridge"`` or ``"app"`` for a logger name, memoized."""
+    source = _source_cache.get(name)
+    if source is None:
+        source = "das_bridge" if name.startswith(_DAS_BRIDGE_PREFIXES) else "app"
+        _source_cache[name] = source
+    return source
 
 
 class LogBufferHandler(logging.Handler):
     """Logging handler that writes formatted records into a :class:`LogBuffer`."""
 
-    DAS_BRIDGE_PREFIXES = ("das_bridge",)
-
     def __init__(self, buffer: LogBuffer) -> None:
         """Initialize the handler with a target log buffer."""
         super().__init__()
@@ -77,49 +183,78 @@ class LogBufferHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Format and append a log record to the buffer."""
         try:
-            source = (
-                "das_bridge"
-                if record.name.startswith(self.DAS_BRIDGE_PREFIXES)
-                else "app"
-            )
             self.buffer.append(
-                {
-                    "timestamp": record.created,
-                    "level": record.levelname,
-                    "source": source,
-                    "logger": record.name,
-                    "message": self.format(record),
-                }
+                LogEntry(
+                    timestamp=record.created,
+                    level=record.levelname,
+                    source=_source_of(record.name),
+                    logger=record.name,
+                    message=self.format(record),
+                )
             )
         except Exception:
             self.handleError(record)
 
 
 class _SourceFilter(logging.Filter):
-    """Route log records by logger-name prefix."""
+    """Route log records by source tag (see :func:`_source_of`)."""
 
-    def __init__(
-        self,
-        *,
-        include_prefix: str = "",
-        exclude_prefix: str = "",
-    ) -> None:
+    def __init__(self, source: str) -> None:
         super().__init__()
-        self._include = include_prefix
-        self._exclude = exclude_prefix
+        self._source = source
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if self._include:
-            return record.name.startswith(self._include)
-        if self._exclude:
-            return not record.name.startswith(self._exclude)
-        return True
+        return _source_of(record.name) == self._source
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes instead of flushing every record.
+
+    Records below WARNING stay in a 64 KiB buffer until the periodic flush in
+    :func:`configure_logging` (or close); WARNING and above flush at once so
+    problems reach disk even if the process dies.
+    """
+
+    def _open(self) -> TextIOWrapper:
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only for WARNING and above."""
+        if self.stream is None:
+            super().emit(record)  # reopens after close(), then flushes
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_periodically(handlers: tuple[logging.Handler, ...]) -> None:
+    """Flush *handlers* every ``_FILE_FLUSH_INTERVAL`` seconds, forever."""
+    while True:
+        time.sleep(_FILE_FLUSH_INTERVAL)
+        for handler in handlers:
+            handler.flush()
 
 
 # Module-level singleton so it can be imported anywhere.
 log_buffer = LogBuffer()
 
 _LOG_FMT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+# Buffer entries carry timestamp, level and logger as their own fields, so the
+# message is left bare (no per-record strftime for the buffer)
+_BUFFER_FMT = "%(message)s"
+
+_FILE_BUFFER_SIZE = 64 * 1024
+_FILE_FLUSH_INTERVAL = 1.0  # seconds
 
 
 def configure_logging(level: str, log_base: pathlib.Path) -> None:
@@ -131,6 +266,12 @@ def configure_logging(level: str, log_base: pathlib.Path) -> None:
     log_level = getattr(logging, level.upper(), logging.INFO)
     formatter = logging.Formatter(_LOG_FMT)
 
+    # None of the formats use thread, process or task fields; skip filling them in
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     # Console
     logging.basicConfig(level=log_level, format=_LOG_FMT)
 
@@ -138,21 +279,35 @@ def configure_logging(level: str, log_base: pathlib.Path) -> None:
 
     # In-memory buffer (for WebSocket streaming)
     buf_handler = LogBufferHandler(log_buffer)
-    buf_handler.setFormatter(formatter)
+    buf_handler.setFormatter(logging.Formatter(_BUFFER_FMT))
     root.addHandler(buf_handler)
 
     # Per-run directory with separate files
     log_dir = log_base / datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    app_handler = logging.FileHandler(log_dir / "app.log")
+    app_handler = _BufferedFileHandler(log_dir / "app.log", encoding="utf-8")
     app_handler.setLevel(log_level)
     app_handler.setFormatter(formatter)
-    app_handler.addFilter(_SourceFilter(exclude_prefix="das_bridge"))
-    root.addHandler(app_handler)
+    app_handler.addFilter(_SourceFilter("app"))
 
-    bridge_handler = logging.FileHandler(log_dir / "das_bridge.log")
+    bridge_handler = _BufferedFileHandler(log_dir / "das_bridge.log", encoding="utf-8")
     bridge_handler.setLevel(log_level)
     bridge_handler.setFormatter(formatter)
-    bridge_handler.addFilter(_SourceFilter(include_prefix="das_bridge"))
-    root.addHandler(bridge_handler)
+    bridge_handler.addFilter(_SourceFilter("das_bridge"))
+
+    # Disk writes happen on the listener's thread, so logging callers (the
+    # event loop included) never block on file I/O
+    file_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(QueueHandler(file_queue))
+    listener = QueueListener(
+        file_queue, app_handler, bridge_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    threading.Thread(
+        target=_flush_periodically,
+        args=((app_handler, bridge_handler),),
+        name="log-flusher",
+        daemon=True,
+    ).start()
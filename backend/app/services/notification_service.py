@@ -6,35 +6,74 @@ Manages connected WebSocket clients and broadcasts state updates.
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
+from collections.abc import Iterable
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Queued messages are flushed once this many are pending or once the batch
+# window has elapsed, whichever comes first.
+_BATCH_MAX = 32
+_BATCH_WINDOW = 0.005  # seconds
+
+# A client that can't take a frame within this long is dropped
+_SEND_TIMEOUT = 5.0  # seconds
+# Close code for dropped clients; the UI reconnects on any close
+_DROPPED_CLOSE_CODE = 1011
+
+# Broadcasts fan out this many sends at a time, yielding to the loop between
+# groups so a large fan-out doesn't starve HTTP handlers
+_SEND_CHUNK = 50
+
+# Cap on sends in flight across all concurrent broadcasts
+_MAX_CONCURRENT_SENDS = 100
+
+
+def _encode(msg_type: str, data: dict[str, Any] | None) -> str:
+    """Encode a message envelope as JSON text.
+
+    Sent as a text frame because the UI parses ``event.data`` as a string.
+    Non-string keys are stringified, as ``json.dumps`` did.
+    """
+    return orjson.dumps(
+        {"type": msg_type, "data": data or {}}, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
 
 class NotificationService:
     """Manage WebSocket connections and broadcast messages."""
 
     def __init__(self) -> None:
-        """Initialize with an empty connection list."""
-        self._connections: list[WebSocket] = []
-        self._lock = asyncio.Lock()
+        """Initialize with an empty connection set."""
+        # Copy-on-write: connect/disconnect publish a new frozenset, so a
+        # broadcast can iterate the one it picked up across awaits, unlocked
+        self._connections: frozenset[WebSocket] = frozenset()
+        # Bumped on every connect, so a reconnect that keeps the count the
+        # same is still visible to pollers
+        self._generation = 0
+        self._send_sem = asyncio.Semaphore(_MAX_CONCURRENT_SENDS)
+        # Close handshakes for dropped clients, kept referenced until done
+        self._closing: set[asyncio.Task[None]] = set()
+
+        # Micro-batched messages (see ``enqueue``)
+        self._pending: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        self._batcher: asyncio.Task[None] | None = None
 
     async def connect(self, ws: WebSocket) -> None:
         """Register a new WebSocket connection."""
         await ws.accept()
-        async with self._lock:
-            self._connections.append(ws)
+        self._connections = self._connections | {ws}
+        self._generation += 1
         logger.info("WebSocket client connected (%d total)", len(self._connections))
 
     async def disconnect(self, ws: WebSocket) -> None:
         """Unregister a WebSocket connection."""
-        async with self._lock:
-            if ws in self._connections:
-                self._connections.remove(ws)
+        self._connections = self._connections - {ws}
         logger.info(
             "WebSocket client disconnected (%d remaining)", len(self._connections)
         )
@@ -43,26 +82,121 @@ class NotificationService:
         self, msg_type: str, data: dict[str, Any] | None = None
     ) -> None:
         """Send a message to all connected WebSocket clients."""
-        message = json.dumps({"type": msg_type, "data": data or {}})
-        async with self._lock:
-            dead: list[WebSocket] = []
-            for ws in self._connections:
+        message = _encode(msg_type, data)
+        # Send to each group of clients at once so a slow one doesn't delay
+        # the rest
+        dead: list[WebSocket] = []
+        for i, chunk in enumerate(itertools.batched(self._connections, _SEND_CHUNK)):
+            if i:
+                await asyncio.sleep(0)
+            results = await asyncio.gather(
+                *(self._send(ws, message) for ws in chunk), return_exceptions=True
+            )
+            dead.extend(
+                ws
+                for ws, result in zip(chunk, results, strict=True)
+                if isinstance(result, Exception)
+            )
+        if dead:
+            self._drop(dead)
+
+    def _drop(self, dead: Iterable[WebSocket]) -> None:
+        """Unregister *dead* clients and close their sockets in the background.
+
+        Closing matters: the endpoint's receive loop would otherwise keep the
+        socket open, and the browser would sit "connected" without updates
+        instead of reconnecting.
+        """
+        dead = frozenset(dead)
+        self._connections = self._connections - dead
+        logger.warning(
+            "Dropped %d unresponsive WebSocket client(s) (%d remaining)",
+            len(dead),
+            len(self._connections),
+        )
+        for ws in dead:
+            task = asyncio.create_task(self._close(ws))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(ws: WebSocket) -> None:
+        """Close a dropped client's socket, ignoring a broken transport."""
+        try:
+            await asyncio.wait_for(ws.close(code=_DROPPED_CLOSE_CODE), _SEND_TIMEOUT)
+        except Exception as e:
+            logger.debug("Closing dropped WebSocket client failed: %s", e)
+
+    async def _send(self, ws: WebSocket, message: str) -> None:
+        """Send one broadcast frame, bounded by the shared send semaphore."""
+        async with self._send_sem:
+            await asyncio.wait_for(ws.send_text(message), _SEND_TIMEOUT)
+
+    def enqueue(self, msg_type: str, data: dict[str, Any] | None = None) -> None:
+        """Queue a message for micro-batched broadcast without awaiting the send.
+
+        Messages queued within a short window are coalesced: consecutive
+        messages of the same type go out as one ``<msg_type>_batch`` frame
+        whose data is ``{"items": [...]}``; a lone message is broadcast
+        unchanged. Frames keep the order in which messages were queued.
+        """
+        self._pending.put_nowait((msg_type, data or {}))
+        if self._batcher is None or self._batcher.done():
+            self._batcher = asyncio.create_task(
+                self._drain_pending(), name="notification-batcher"
+            )
+
+    async def _drain_pending(self) -> None:
+        """Collect queued messages into batches and broadcast them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(batch) < _BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
                 try:
-                    await ws.send_text(message)
-                except Exception:
-                    dead.append(ws)
-            for ws in dead:
-                self._connections.remove(ws)
+                    batch.append(await asyncio.wait_for(self._pending.get(), remaining))
+                except TimeoutError:
+                    break
+
+            # Merge only consecutive runs of one type so frames keep arrival
+            # order (an alert must not overtake an earlier actions_queued)
+            for msg_type, run in itertools.groupby(batch, key=lambda m: m[0]):
+                items = [data for _, data in run]
+                try:
+                    if len(items) == 1:
+                        await self.broadcast(msg_type, items[0])
+                    else:
+                        await self.broadcast(f"{msg_type}_batch", {"items": items})
+                except Exception as e:
+                    logger.error("Failed to broadcast %s batch: %s", msg_type, e)
+
+    async def aclose(self) -> None:
+        """Stop the batcher and pending close handshakes (app shutdown)."""
+        tasks = [*self._closing]
+        if self._batcher is not None:
+            tasks.append(self._batcher)
+            self._batcher = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def send_to(
         self, ws: WebSocket, msg_type: str, data: dict[str, Any] | None = None
     ) -> None:
         """Send a message to a specific WebSocket client."""
-        message = json.dumps({"type": msg_type, "data": data or {}})
+        message = _encode(msg_type, data)
         try:
             await ws.send_text(message)
         except Exception:
-            await self.disconnect(ws)
+            self._drop((ws,))
+
+    @property
+    def generation(self) -> int:
+        """Return a counter that increases with every new connection."""
+        return self._generation
 
     @property
     def client_count(self) -> int:
@@ -162,8 +162,11 @@ export type WSMessageType =
   | "order_cancelled"
   | "order_replaced"
   | "alert"
+  | "alert_batch"
   | "buying_power_warning"
   | "action_queued"
+  | "actions_queued"
+  | "actions_queued_batch"
   | "queued_actions_available"
   | "actions_replayed"
   | "short_sale_task_update"
@@ -166,6 +166,12 @@ export const useAppStore = create<AppState>((set, get) => ({
         });
         break;
 
+      case "alert_batch":
+        for (const item of (data.items ?? []) as Record<string, unknown>[]) {
+          state.handleWSMessage("alert", item);
+        }
+        break;
+
       case "buying_power_warning":
         state.addAlert({
           type: "warning",
@@ -182,6 +188,18 @@ export const useAppStore = create<AppState>((set, get) => ({
         });
         break;
 
+      case "actions_queued":
+        for (const entry of (data.entries ?? []) as Record<string, unknown>[]) {
+          state.handleWSMessage("action_queued", entry);
+        }
+        break;
+
+      case "actions_queued_batch":
+        for (const item of (data.items ?? []) as Record<string, unknown>[]) {
+          state.handleWSMessage("actions_queued", item);
+        }
+        break;
+
       case "queued_actions_available": {
         const fid = String(data.follower_id);
         const actions = (data.actions ?? []) as unknown as QueuedAction[];
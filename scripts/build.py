@@ -2,7 +2,7 @@
 """
 build.py – Generate and run PyInstaller spec for DAS Copy Trader
 
-Usage:  python scripts/build.py --das-bridge-dir /path/to/das-bridge --static-dir /path/to/static
+Usage:  python scripts/build.py --das-bridge-dir /path/to/das-bridge --static-dir /path/to/static [--dev]
 """
 
 import argparse
@@ -19,6 +19,11 @@ parser.add_argument(
 parser.add_argument(
     "--static-dir", required=True, help="Path to static frontend directory"
 )
+parser.add_argument(
+    "--dev",
+    action="store_true",
+    help="Incremental build: reuse PyInstaller's cache instead of --clean",
+)
 args = parser.parse_args()
 
 BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
@@ -56,11 +61,22 @@ opts = [
     "das_bridge",
     "--collect-data",
     "das_bridge",
+    # Strip asserts from the bundled bytecode; level 2 would also strip
+    # docstrings, which FastAPI reads for the OpenAPI descriptions
+    "--optimize",
+    "1",
+    "--exclude-module",
+    "tkinter",
+    "--exclude-module",
+    "test",
     "--noconfirm",
-    "--clean",
+    "--workpath",
+    str(BACKEND_DIR / "build"),
     "--distpath",
     str(BACKEND_DIR / "dist"),
 ]
+if not args.dev:
+    opts.append("--clean")
 
 print("Running PyInstaller with options:")
 for o in opts: